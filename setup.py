@@ -30,6 +30,9 @@ setup(
             "ruff>=0.1.0,<0.2.0",
             "types-requests>=2.31.0,<3.0.0",
         ],
+        "speedups": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
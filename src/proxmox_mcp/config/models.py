@@ -5,6 +5,8 @@ This module defines Pydantic models for configuration validation:
 - Proxmox connection settings
 - Authentication credentials
 - Logging configuration
+- Read-only tool caching
+- MCP transport selection
 - Tool-specific parameter models
 
 The models provide:
@@ -13,7 +15,7 @@ The models provide:
 - Field descriptions
 - Required vs optional field handling
 """
-from typing import Optional, Annotated
+from typing import Optional, Annotated, Literal
 from pydantic import BaseModel, Field
 
 class NodeStatus(BaseModel):
@@ -68,6 +70,27 @@ class LoggingConfig(BaseModel):
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"  # Optional: Log format
     file: Optional[str] = None  # Optional: Log file path (default: None for console logging)
 
+class CacheConfig(BaseModel):
+    """Model for read-only tool caching configuration.
+    
+    Controls how long results of read-only tools (node, VM,
+    storage and cluster listings) are reused before Proxmox
+    is queried again. A TTL of 0 disables caching.
+    """
+    ttl_seconds: float = 5.0  # Optional: Cache lifetime in seconds (default: 5)
+    maxsize: int = 256  # Optional: Maximum cached entries (default: 256)
+
+class TransportConfig(BaseModel):
+    """Model for MCP transport configuration.
+    
+    Selects how clients reach the server. "stdio" is the
+    default for locally spawned servers; "http" serves the
+    streamable HTTP transport on the given host and port.
+    """
+    type: Literal["stdio", "http"] = "stdio"  # Optional: Transport type (default: stdio)
+    host: str = "127.0.0.1"  # Optional: HTTP bind address (default: 127.0.0.1)
+    port: int = 8812  # Optional: HTTP port (default: 8812)
+
 class Config(BaseModel):
     """Root configuration model.
     
@@ -78,3 +101,5 @@ class Config(BaseModel):
     proxmox: ProxmoxConfig  # Required: Proxmox connection settings
     auth: AuthConfig  # Required: Authentication credentials
     logging: LoggingConfig  # Required: Logging configuration
+    cache: CacheConfig = CacheConfig()  # Optional: Read-only tool caching
+    transport: TransportConfig = TransportConfig()  # Optional: MCP transport settings
@@ -5,6 +5,7 @@ This module handles the core Proxmox API integration, providing:
 - Secure API connection setup and management
 - Token-based authentication
 - Connection testing and validation
+- HTTP connection pooling and keep-alive
 - Error handling for API operations
 
 The ProxmoxManager class serves as the central point for all Proxmox API
@@ -12,10 +13,32 @@ interactions, ensuring consistent connection handling and authentication
 across the MCP server.
 """
 import logging
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Optional
+import requests
 from proxmoxer import ProxmoxAPI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..config.models import ProxmoxConfig, AuthConfig
 
+def _pool_size_from_env(default: int) -> int:
+    """Read the connection pool size from PROXMOX_POOL_MAXSIZE, if set."""
+    value = os.getenv("PROXMOX_POOL_MAXSIZE")
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.getLogger("proxmox-mcp.proxmox").warning(
+            f"Ignoring invalid PROXMOX_POOL_MAXSIZE={value!r}, using {default}"
+        )
+        return default
+
+# Connection pool sizing for the shared HTTPS session. Parallel tool code
+# sizes its worker pools from POOL_MAXSIZE so bursts never overflow it.
+POOL_MAXSIZE = _pool_size_from_env(32)
+POOL_CONNECTIONS = POOL_MAXSIZE
+
 class ProxmoxManager:
     """Manager class for Proxmox API operations.
     
@@ -38,6 +61,7 @@ class ProxmoxManager:
         """
         self.logger = logging.getLogger("proxmox-mcp.proxmox")
         self.config = self._create_config(proxmox_config, auth_config)
+        self.session: Optional[requests.Session] = None
         self.api = self._setup_api()
 
     def _create_config(self, proxmox_config: ProxmoxConfig, auth_config: AuthConfig) -> Dict[str, Any]:
@@ -89,6 +113,7 @@ class ProxmoxManager:
         try:
             self.logger.info(f"Connecting to Proxmox host: {self.config['host']}")
             api = ProxmoxAPI(**self.config)
+            self._configure_session(api)
             
             # Test connection
             api.version.get()
@@ -99,6 +124,34 @@ class ProxmoxManager:
             self.logger.error(f"Failed to connect to Proxmox: {e}")
             raise RuntimeError(f"Failed to connect to Proxmox: {e}")
 
+    def _configure_session(self, api: ProxmoxAPI) -> None:
+        """Mount a pooled, retrying adapter on the API's HTTP session.
+
+        proxmoxer keeps a single requests session for the lifetime of the
+        API object. Enlarging its connection pool lets concurrent tool calls
+        reuse open keep-alive connections instead of repeating the TCP and
+        TLS handshake for every request. The pool does not block: a burst
+        beyond POOL_MAXSIZE opens extra short-lived connections. Only GET
+        requests that failed to connect are retried; mutating calls and read
+        timeouts are never replayed, since the server may already have acted.
+
+        Args:
+            api: Freshly created ProxmoxAPI instance
+        """
+        session = getattr(api, "_store", {}).get("session")
+        if not isinstance(session, requests.Session):
+            self.logger.debug("Proxmox backend has no requests session, skipping pool setup")
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=Retry(total=2, read=0, backoff_factor=0.2, allowed_methods=["GET"])
+        )
+        session.mount("https://", adapter)
+        self.session = session
+
     def get_api(self) -> ProxmoxAPI:
         """Get the initialized Proxmox API instance.
         
@@ -110,3 +163,13 @@ class ProxmoxManager:
             ProxmoxAPI instance ready for making API calls
         """
         return self.api
+
+    def close(self) -> None:
+        """Close the pooled HTTP session.
+
+        Releases keep-alive connections back to the OS. Safe to call more
+        than once.
+        """
+        if self.session is not None:
+            self.session.close()
+            self.session = None
@@ -1,7 +1,7 @@
 """
 Output templates for Proxmox MCP resource types.
 """
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any
 from .formatters import ProxmoxFormatters
 from .theme import ProxmoxTheme
 from .colors import ProxmoxColors
@@ -95,11 +95,11 @@ class ProxmoxTemplates:
         return "\n".join(result)
     
     @staticmethod
-    def vm_list(vms: List[Dict[str, Any]]) -> str:
+    def vm_list(vms: Iterable[Dict[str, Any]]) -> str:
         """Template for VM list output.
         
         Args:
-            vms: List of VM data dictionaries
+            vms: VM data dictionaries (any iterable; consumed once)
             
         Returns:
             Formatted VM list string
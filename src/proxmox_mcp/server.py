@@ -13,21 +13,29 @@ The server exposes a set of tools for managing Proxmox resources including:
 - VM operations
 - Storage management
 - Cluster status monitoring
+- Batched execution of the tools above
 """
+import asyncio
+import importlib.util
+import inspect
+import json
 import logging
 import os
 import sys
 import signal
-from typing import Optional, List, Annotated
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, List, Literal, Tuple, Annotated
 
+import anyio
 from mcp.server.fastmcp import FastMCP
-from mcp.server.fastmcp.tools import Tool
 from mcp.types import TextContent as Content
 from pydantic import Field
 
 from .config.loader import load_config
+from .config.models import Config
 from .core.logging import setup_logging
 from .core.proxmox import ProxmoxManager
+from .utils.cache import TTLCache
 from .tools.node import NodeTools
 from .tools.vm import VMTools
 from .tools.storage import StorageTools
@@ -36,6 +44,7 @@ from .tools.definitions import (
     GET_NODES_DESC,
     GET_NODE_STATUS_DESC,
     GET_VMS_DESC,
+    GET_VMS_BULK_DESC,
     CREATE_VM_DESC,
     EXECUTE_VM_COMMAND_DESC,
     START_VM_DESC,
@@ -43,14 +52,70 @@ from .tools.definitions import (
     SHUTDOWN_VM_DESC,
     RESET_VM_DESC,
     DELETE_VM_DESC,
-    GET_CONTAINERS_DESC,
     GET_STORAGE_DESC,
-    GET_CLUSTER_STATUS_DESC
+    GET_CLUSTER_STATUS_DESC,
+    GET_CLUSTER_RESOURCES_DESC,
+    BATCH_EXECUTE_DESC
 )
 
+if TYPE_CHECKING:
+    from proxmoxer import ProxmoxAPI
+
+# uvloop is an optional speedup (pip install "proxmox-mcp[speedups]")
+_HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+# How long a signalled shutdown may take before the process is forced out
+SHUTDOWN_GRACE_SECONDS = 5.0
+
+# Shared parameter types, built once at import instead of per tool
+NODE_ARG = Annotated[str, Field(description="Host node name (e.g. 'pve')")]
+VMID_ARG = Annotated[str, Field(description="VM ID number (e.g. '101')")]
+
+def _check_vmid(vmid: str) -> None:
+    """Reject VM IDs that are not plain digit strings.
+
+    A cheap guard run inside each VM handler so malformed IDs fail before
+    any Proxmox round-trip, including calls routed through batch_execute,
+    which bypasses FastMCP's argument validation.
+
+    Raises:
+        ValueError: If vmid is not a non-empty string of digits
+    """
+    if not (isinstance(vmid, str) and vmid.isdigit()):
+        raise ValueError(f"Invalid VM ID {vmid!r}: expected a numeric string such as '101'")
+
 class ProxmoxMCPServer:
     """Main server class for Proxmox MCP."""
 
+    # Fixed attribute layout: faster lookups on the hot dispatch path and no
+    # per-instance __dict__
+    __slots__ = (
+        "config",
+        "logger",
+        "proxmox_manager",
+        "proxmox",
+        "node_tools",
+        "vm_tools",
+        "storage_tools",
+        "cluster_tools",
+        "mcp",
+        "_cache",
+        "_inflight",
+        "_generation",
+        "_shutdown_timer",
+        "_tool_registry",
+    )
+
+    config: Config
+    logger: logging.Logger
+    proxmox_manager: ProxmoxManager
+    proxmox: "ProxmoxAPI"
+    node_tools: NodeTools
+    vm_tools: VMTools
+    storage_tools: StorageTools
+    cluster_tools: ClusterTools
+    mcp: FastMCP
+
     def __init__(self, config_path: Optional[str] = None):
         """Initialize the server.
 
@@ -70,8 +135,23 @@ class ProxmoxMCPServer:
         self.storage_tools = StorageTools(self.proxmox)
         self.cluster_tools = ClusterTools(self.proxmox)
         
+        # Short-lived cache for read-only tool results
+        self._cache = TTLCache(
+            maxsize=self.config.cache.maxsize,
+            ttl=self.config.cache.ttl_seconds
+        )
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+        # Bumped around every mutation; fetches started under an older
+        # generation may have read pre-mutation state and are not cached
+        self._generation = 0
+        self._shutdown_timer: Optional[threading.Timer] = None
+        
         # Initialize MCP server
-        self.mcp = FastMCP("ProxmoxMCP")
+        self.mcp = FastMCP(
+            "ProxmoxMCP",
+            host=self.config.transport.host,
+            port=self.config.transport.port
+        )
         self._setup_tools()
 
     def _setup_tools(self) -> None:
@@ -82,121 +162,387 @@ class ProxmoxMCPServer:
         - VM operation tools (list VMs, execute commands, power management)
         - Storage management tools (list storage)
         - Cluster tools (get cluster status)
+        - Batch tool (run several of the above in one request)
         
         Each tool is registered with appropriate descriptions and parameter
-        validation using Pydantic models.
+        validation using Pydantic models. Handlers are async and run the
+        blocking Proxmox API calls in worker threads, so a slow request
+        does not stall other in-flight tool calls.
         """
+        # Bind implementations once so each call skips the attribute lookups
+        cached, invalidating, execute_batch = self._cached, self._invalidating, self._execute_batch
+        node_tools, vm_tools = self.node_tools, self.vm_tools
+        get_nodes_impl = node_tools.get_nodes
+        get_node_status_impl = node_tools.get_node_status
+        get_vms_impl = vm_tools.get_vms
+        get_vms_bulk_impl = vm_tools.get_vms_bulk
+        create_vm_impl = vm_tools.create_vm
+        execute_command_impl = vm_tools.execute_command
+        start_vm_impl = vm_tools.start_vm
+        stop_vm_impl = vm_tools.stop_vm
+        shutdown_vm_impl = vm_tools.shutdown_vm
+        reset_vm_impl = vm_tools.reset_vm
+        delete_vm_impl = vm_tools.delete_vm
+        get_storage_impl = self.storage_tools.get_storage
+        get_cluster_status_impl = self.cluster_tools.get_cluster_status
+        get_cluster_resources_impl = self.cluster_tools.get_cluster_resources
         
         # Node tools
-        @self.mcp.tool(description=GET_NODES_DESC)
-        def get_nodes():
-            return self.node_tools.get_nodes()
+        async def get_nodes():
+            return await cached("get_nodes", get_nodes_impl)
 
-        @self.mcp.tool(description=GET_NODE_STATUS_DESC)
-        def get_node_status(
-            node: Annotated[str, Field(description="Name/ID of node to query (e.g. 'pve1', 'proxmox-node2')")]
+        async def get_node_status(
+            node: NODE_ARG
         ):
-            return self.node_tools.get_node_status(node)
+            return await cached("get_node_status", get_node_status_impl, node)
 
         # VM tools
-        @self.mcp.tool(description=GET_VMS_DESC)
-        def get_vms():
-            return self.vm_tools.get_vms()
+        async def get_vms(
+            detailed: Annotated[bool, Field(description="Read CPU cores from each VM's config (slower)", default=False)] = False
+        ):
+            return await cached("get_vms", get_vms_impl, detailed)
+
+        async def get_vms_bulk(
+            node: NODE_ARG,
+            vmids: Annotated[List[str], Field(description="VM ID numbers (e.g. ['100', '101'])")]
+        ):
+            for vmid in vmids:
+                _check_vmid(vmid)
+            return await get_vms_bulk_impl(node, vmids)
 
-        @self.mcp.tool(description=CREATE_VM_DESC)
-        def create_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve')")],
+        async def create_vm(
+            node: NODE_ARG,
             vmid: Annotated[str, Field(description="New VM ID number (e.g. '200', '300')")],
             name: Annotated[str, Field(description="VM name (e.g. 'my-new-vm', 'web-server')")],
-            cpus: Annotated[int, Field(description="Number of CPU cores (e.g. 1, 2, 4)", ge=1, le=32)],
-            memory: Annotated[int, Field(description="Memory size in MB (e.g. 2048 for 2GB)", ge=512, le=131072)],
-            disk_size: Annotated[int, Field(description="Disk size in GB (e.g. 10, 20, 50)", ge=5, le=1000)],
+            cpus: Annotated[int, Field(description="Number of CPU cores, 1-32 (e.g. 1, 2, 4)")],
+            memory: Annotated[int, Field(description="Memory size in MB, 512-131072 (e.g. 2048 for 2GB)")],
+            disk_size: Annotated[int, Field(description="Disk size in GB, 5-1000 (e.g. 10, 20, 50)")],
             storage: Annotated[Optional[str], Field(description="Storage name (optional, will auto-detect)", default=None)] = None,
             ostype: Annotated[Optional[str], Field(description="OS type (optional, default: 'l26' for Linux)", default=None)] = None
         ):
-            return self.vm_tools.create_vm(node, vmid, name, cpus, memory, disk_size, storage, ostype)
+            _check_vmid(vmid)
+            return await invalidating(create_vm_impl, node, vmid, name, cpus, memory, disk_size, storage, ostype)
 
-        @self.mcp.tool(description=EXECUTE_VM_COMMAND_DESC)
         async def execute_vm_command(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")],
+            node: NODE_ARG,
+            vmid: VMID_ARG,
             command: Annotated[str, Field(description="Shell command to run (e.g. 'uname -a', 'systemctl status nginx')")]
         ):
-            return await self.vm_tools.execute_command(node, vmid, command)
+            _check_vmid(vmid)
+            return await execute_command_impl(node, vmid, command)
 
         # VM Power Management tools
-        @self.mcp.tool(description=START_VM_DESC)
-        def start_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '101')")]
+        async def start_vm(
+            node: NODE_ARG,
+            vmid: VMID_ARG
         ):
-            return self.vm_tools.start_vm(node, vmid)
+            _check_vmid(vmid)
+            return await invalidating(start_vm_impl, node, vmid)
 
-        @self.mcp.tool(description=STOP_VM_DESC)
-        def stop_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '101')")]
+        async def stop_vm(
+            node: NODE_ARG,
+            vmid: VMID_ARG
         ):
-            return self.vm_tools.stop_vm(node, vmid)
+            _check_vmid(vmid)
+            return await invalidating(stop_vm_impl, node, vmid)
 
-        @self.mcp.tool(description=SHUTDOWN_VM_DESC)
-        def shutdown_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '101')")]
+        async def shutdown_vm(
+            node: NODE_ARG,
+            vmid: VMID_ARG
         ):
-            return self.vm_tools.shutdown_vm(node, vmid)
+            _check_vmid(vmid)
+            return await invalidating(shutdown_vm_impl, node, vmid)
 
-        @self.mcp.tool(description=RESET_VM_DESC)
-        def reset_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '101')")]
+        async def reset_vm(
+            node: NODE_ARG,
+            vmid: VMID_ARG
         ):
-            return self.vm_tools.reset_vm(node, vmid)
+            _check_vmid(vmid)
+            return await invalidating(reset_vm_impl, node, vmid)
 
-        @self.mcp.tool(description=DELETE_VM_DESC)
-        def delete_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '998')")],
+        async def delete_vm(
+            node: NODE_ARG,
+            vmid: VMID_ARG,
             force: Annotated[bool, Field(description="Force deletion even if VM is running", default=False)] = False
         ):
-            return self.vm_tools.delete_vm(node, vmid, force)
+            _check_vmid(vmid)
+            return await invalidating(delete_vm_impl, node, vmid, force)
 
         # Storage tools
-        @self.mcp.tool(description=GET_STORAGE_DESC)
-        def get_storage():
-            return self.storage_tools.get_storage()
+        async def get_storage():
+            return await cached("get_storage", get_storage_impl)
 
         # Cluster tools
-        @self.mcp.tool(description=GET_CLUSTER_STATUS_DESC)
-        def get_cluster_status():
-            return self.cluster_tools.get_cluster_status()
+        async def get_cluster_status():
+            return await cached("get_cluster_status", get_cluster_status_impl)
+
+        async def get_cluster_resources(
+            type: Annotated[
+                Optional[Literal["vm", "storage", "node", "sdn"]],
+                Field(description="Only return one resource type (optional)", default=None)
+            ] = None
+        ):
+            return await cached("get_cluster_resources", get_cluster_resources_impl, type)
+
+        # Batch tools
+        async def batch_execute(
+            operations: Annotated[List[Dict[str, Any]], Field(description="List of {'tool': name, 'args': {...}} entries")],
+            max_concurrent: Annotated[int, Field(description="Maximum operations running at once", ge=1, le=32)] = 8,
+            stop_on_error: Annotated[bool, Field(description="Skip operations not yet started after a failure")] = False,
+            timeout_ms: Annotated[int, Field(description="Per-operation timeout in milliseconds", ge=100)] = 30000
+        ):
+            return await execute_batch(operations, max_concurrent, stop_on_error, timeout_ms)
+
+        # Single table drives both MCP registration and batch dispatch
+        tool_specs: List[Tuple[str, Callable[..., Any], str]] = [
+            ("get_nodes", get_nodes, GET_NODES_DESC),
+            ("get_node_status", get_node_status, GET_NODE_STATUS_DESC),
+            ("get_vms", get_vms, GET_VMS_DESC),
+            ("get_vms_bulk", get_vms_bulk, GET_VMS_BULK_DESC),
+            ("create_vm", create_vm, CREATE_VM_DESC),
+            ("execute_vm_command", execute_vm_command, EXECUTE_VM_COMMAND_DESC),
+            ("start_vm", start_vm, START_VM_DESC),
+            ("stop_vm", stop_vm, STOP_VM_DESC),
+            ("shutdown_vm", shutdown_vm, SHUTDOWN_VM_DESC),
+            ("reset_vm", reset_vm, RESET_VM_DESC),
+            ("delete_vm", delete_vm, DELETE_VM_DESC),
+            ("get_storage", get_storage, GET_STORAGE_DESC),
+            ("get_cluster_status", get_cluster_status, GET_CLUSTER_STATUS_DESC),
+            ("get_cluster_resources", get_cluster_resources, GET_CLUSTER_RESOURCES_DESC),
+        ]
+        for name, handler, description in tool_specs:
+            self.mcp.add_tool(handler, name=name, description=description)
+
+        # Handlers reachable through batch_execute, keyed by tool name
+        self._tool_registry: Dict[str, Callable[..., Any]] = {
+            name: handler for name, handler, _ in tool_specs
+        }
+
+        self.mcp.add_tool(batch_execute, name="batch_execute", description=BATCH_EXECUTE_DESC)
+
+    async def _cached(self, name: str, handler: Callable[..., Any], *args: Any) -> Any:
+        """Call a read-only handler, reusing a recent result for the same arguments.
+
+        Cache hits are served directly on the event loop; misses run the
+        blocking handler in a worker thread. Concurrent misses for the same
+        key share a single in-flight request instead of each querying
+        Proxmox.
+
+        Args:
+            name: Tool name, used as the first element of the cache key
+            handler: Tool method to call on a cache miss
+            *args: Positional arguments forwarded to the handler
+
+        Returns:
+            The cached or freshly computed handler result
+        """
+        key = (name, *args)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        # Coalesce concurrent identical requests onto one fetch. The fetch
+        # runs as its own task and every caller, including the one that
+        # started it, awaits it through a shield: cancelling any caller
+        # (e.g. a batch_execute timeout) never cancels the others.
+        task = self._inflight.get(key)
+        if task is None:
+            generation = self._generation
+            task = asyncio.ensure_future(asyncio.to_thread(handler, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_fetch(key, done, generation))
+        return await asyncio.shield(task)
+
+    def _finish_fetch(
+        self, key: Tuple[Any, ...], task: "asyncio.Future[Any]", generation: int
+    ) -> None:
+        """Retire a finished shared fetch and cache its result if it succeeded.
+
+        The result is only cached when no mutation started or finished
+        while the fetch was running.
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        # Retrieving the exception also stops asyncio warning about it when
+        # every caller was cancelled before the fetch finished
+        if task.exception() is None and generation == self._generation:
+            self._cache.set(key, task.result())
+
+    def _invalidate(self) -> None:
+        """Drop cached and in-flight read-only results and start a new generation."""
+        self._generation += 1
+        self._inflight.clear()
+        self._cache.clear()
+
+    async def _invalidating(self, handler: Callable[..., Any], *args: Any) -> Any:
+        """Call a mutating handler in a worker thread and drop cached read-only results.
+
+        Cached results are dropped both before the handler starts and once
+        its worker thread has finished, even when the handler fails or the
+        caller is cancelled (e.g. by a batch_execute timeout), since the
+        operation may still change cluster state. Reads that overlap the
+        mutation are not cached.
+
+        Args:
+            handler: Tool method that changes cluster state
+            *args: Positional arguments forwarded to the handler
+
+        Returns:
+            The handler result
+        """
+        self._invalidate()
+        work = asyncio.ensure_future(asyncio.to_thread(handler, *args))
+        work.add_done_callback(self._finish_mutation)
+        return await asyncio.shield(work)
+
+    def _finish_mutation(self, work: "asyncio.Future[Any]") -> None:
+        """Invalidate again once a mutating handler's worker thread is done."""
+        self._invalidate()
+        # Mark a failure as retrieved in case the caller was cancelled
+        if not work.cancelled():
+            work.exception()
+
+    async def _execute_batch(
+        self,
+        operations: List[Dict[str, Any]],
+        max_concurrent: int = 8,
+        stop_on_error: bool = False,
+        timeout_ms: int = 30000,
+    ) -> List[Content]:
+        """Dispatch several registered tools concurrently.
+
+        Each operation runs under a shared semaphore with its own timeout.
+        Sync handlers are moved to a worker thread so blocking Proxmox
+        calls overlap instead of running back to back.
+
+        Args:
+            operations: List of {"tool": name, "args": {...}} entries
+            max_concurrent: Maximum number of operations running at once
+            stop_on_error: Skip operations that have not started once one fails
+            timeout_ms: Per-operation timeout in milliseconds
+
+        Returns:
+            List with one Content object holding a JSON array of
+            {"id", "ok", "result", "error"} entries, in request order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        failed = asyncio.Event()
+
+        async def run_operation(index: int, operation: Dict[str, Any]) -> Dict[str, Any]:
+            entry: Dict[str, Any] = {"id": index, "ok": False, "result": None, "error": None}
+            async with semaphore:
+                if stop_on_error and failed.is_set():
+                    entry["error"] = "Skipped after an earlier operation failed"
+                    return entry
+                try:
+                    name = operation.get("tool")
+                    handler = self._tool_registry.get(name)
+                    if handler is None:
+                        raise ValueError(f"Unknown tool: {name}")
+                    args = operation.get("args") or {}
+                    if inspect.iscoroutinefunction(handler):
+                        call = handler(**args)
+                    else:
+                        call = asyncio.to_thread(handler, **args)
+                    content = await asyncio.wait_for(call, timeout_ms / 1000)
+                    entry["ok"] = True
+                    entry["result"] = "\n".join(item.text for item in content)
+                except asyncio.TimeoutError:
+                    entry["error"] = f"Timed out after {timeout_ms} ms"
+                except Exception as e:
+                    entry["error"] = str(e)
+                if not entry["ok"]:
+                    failed.set()
+            return entry
+
+        results = await asyncio.gather(
+            *(run_operation(index, operation) for index, operation in enumerate(operations))
+        )
+        return [Content(type="text", text=json.dumps(results, indent=2, ensure_ascii=False))]
+
+    async def _run(self) -> None:
+        """Serve MCP requests until the transport closes or a shutdown signal arrives.
+
+        Uses stdio by default, or the streamable HTTP transport when
+        transport.type is "http" in the configuration.
+
+        SIGINT/SIGTERM cancel the task group instead of exiting the process,
+        so in-flight work unwinds normally and start() can release the
+        Proxmox HTTP session. If unwinding stalls for SHUTDOWN_GRACE_SECONDS
+        the process is forced out (see _arm_shutdown_timer). Signal handling is skipped on Windows, where
+        the event loop does not support it; Ctrl+C still raises
+        KeyboardInterrupt there.
+        """
+        async with anyio.create_task_group() as tg:
+            if sys.platform != "win32":
+                tg.start_soon(self._watch_signals, tg.cancel_scope)
+            if self.config.transport.type == "http":
+                self.logger.info(
+                    f"Serving streamable HTTP on {self.config.transport.host}:{self.config.transport.port}"
+                )
+                await self.mcp.run_streamable_http_async()
+            else:
+                await self.mcp.run_stdio_async()
+            tg.cancel_scope.cancel()
+
+    async def _watch_signals(self, scope: anyio.CancelScope) -> None:
+        """Cancel the server scope on the first SIGINT or SIGTERM.
+
+        Args:
+            scope: Cancel scope wrapping the running server
+        """
+        with anyio.open_signal_receiver(signal.SIGINT, signal.SIGTERM) as signals:
+            async for _ in signals:
+                self.logger.info("Received signal to shutdown...")
+                scope.cancel()
+                self._arm_shutdown_timer()
+                return
+
+    def _arm_shutdown_timer(self) -> None:
+        """Force the process to exit if a signalled shutdown stalls.
+
+        Cancelling the server scope cannot interrupt the stdio transport's
+        stdin read, which runs in a worker thread and only returns on the
+        next line or EOF. A client that keeps stdin open (e.g. docker stop
+        or a supervisor sending SIGTERM) would otherwise keep the process,
+        and its Proxmox session, alive indefinitely.
+        """
+        timer = threading.Timer(SHUTDOWN_GRACE_SECONDS, self._force_exit)
+        timer.daemon = True
+        self._shutdown_timer = timer
+        timer.start()
+
+    def _force_exit(self) -> None:
+        """Close the Proxmox session and exit without waiting for blocked threads."""
+        self.logger.warning(
+            f"Shutdown did not finish within {SHUTDOWN_GRACE_SECONDS:g}s, forcing exit"
+        )
+        self.proxmox_manager.close()
+        os._exit(0)
 
     def start(self) -> None:
         """Start the MCP server.
         
         Initializes the server with:
         - Signal handlers for graceful shutdown (SIGINT, SIGTERM)
-        - Async runtime for handling concurrent requests
+        - Async runtime for handling concurrent requests (uvloop when installed)
         - Error handling and logging
         
-        The server runs until terminated by a signal or fatal error.
+        The server runs until terminated by a signal or fatal error. The
+        pooled Proxmox HTTP session is closed on every exit path.
         """
-        import anyio
-
-        def signal_handler(signum, frame):
-            self.logger.info("Received signal to shutdown...")
-            sys.exit(0)
-
-        # Set up signal handlers
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-
         try:
             self.logger.info("Starting MCP server...")
-            anyio.run(self.mcp.run_stdio_async)
+            anyio.run(self._run, backend_options={"use_uvloop": _HAS_UVLOOP})
         except Exception as e:
             self.logger.error(f"Server error: {e}")
             sys.exit(1)
+        finally:
+            if self._shutdown_timer is not None:
+                self._shutdown_timer.cancel()
+            self.proxmox_manager.close()
 
 if __name__ == "__main__":
     config_path = os.getenv("PROXMOX_MCP_CONFIG")
@@ -5,15 +5,16 @@ This module provides tools for monitoring and managing Proxmox clusters:
 - Retrieving overall cluster health status
 - Monitoring quorum status and node count
 - Tracking cluster resources and configuration
+- Listing all cluster resources in a single API call
 - Checking cluster-wide service availability
 
 The tools provide essential information for maintaining
 cluster health and ensuring proper operation.
 """
-from typing import List
+from typing import List, Optional
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
-from .definitions import GET_CLUSTER_STATUS_DESC
+from .definitions import GET_CLUSTER_STATUS_DESC, GET_CLUSTER_RESOURCES_DESC
 
 class ClusterTools(ProxmoxTool):
     """Tools for managing Proxmox cluster.
@@ -76,3 +77,39 @@ class ClusterTools(ProxmoxTool):
             return self._format_response(status, "cluster")
         except Exception as e:
             self._handle_error("get cluster status", e)
+
+    def get_cluster_resources(self, resource_type: Optional[str] = None) -> List[Content]:
+        """List resources across the whole cluster in a single API call.
+
+        Uses Proxmox's aggregate /cluster/resources endpoint, which returns
+        nodes, VMs, containers and storage together. This replaces one
+        query per node (and per VM) with a single round-trip.
+
+        Args:
+            resource_type: Optional filter, one of 'vm', 'storage', 'node'
+                         or 'sdn'. Note that 'vm' covers both QEMU VMs
+                         and LXC containers.
+
+        Returns:
+            List of Content objects containing the raw resource entries:
+            [
+                {
+                    "id": "qemu/100",
+                    "type": "qemu",
+                    "node": "node-name",
+                    "status": "running",
+                    ...additional resource fields
+                }
+            ]
+
+        Raises:
+            RuntimeError: If the cluster resources query fails
+        """
+        try:
+            if resource_type:
+                result = self.proxmox.cluster.resources.get(type=resource_type)
+            else:
+                result = self.proxmox.cluster.resources.get()
+            return self._format_response(result)
+        except Exception as e:
+            self._handle_error("get cluster resources", e)
@@ -19,6 +19,9 @@ Example:
 # VM tool descriptions
 GET_VMS_DESC = """List all virtual machines across the cluster with their status and resource usage.
 
+Parameters:
+detailed - Read CPU cores from each VM's config instead of the cluster summary (optional, slower, default: false)
+
 Example:
 {"vmid": "100", "name": "ubuntu", "status": "running", "cpu": 2, "memory": 4096}"""
 
@@ -103,6 +106,18 @@ This will permanently remove:
 Example:
 Delete test VM with ID 998 on node pve"""
 
+GET_VMS_BULK_DESC = """Get current status for several VMs on one node in a single call.
+
+The per-VM queries run concurrently, so this is much faster than calling a
+status tool once per VM.
+
+Parameters:
+node* - Host node name (e.g. 'pve')
+vmids* - List of VM ID numbers (e.g. ['100', '101', '102'])
+
+Example:
+{"vmid": "100", "name": "ubuntu", "status": "running", "cpus": 2, "memory": 4096}"""
+
 # Container tool descriptions
 GET_CONTAINERS_DESC = """List all LXC containers across the cluster with their status and configuration.
 
@@ -120,3 +135,27 @@ GET_CLUSTER_STATUS_DESC = """Get overall Proxmox cluster health and configuratio
 
 Example:
 {"name": "proxmox", "quorum": "ok", "nodes": 3, "ha_status": "active"}"""
+
+
+GET_CLUSTER_RESOURCES_DESC = """List nodes, VMs, containers and storage across the whole cluster in one call.
+
+Parameters:
+type - Only return one resource type: 'vm', 'storage', 'node' or 'sdn' (optional)
+
+Example:
+[{"id": "qemu/100", "type": "qemu", "node": "pve1", "name": "ubuntu", "status": "running"}]"""
+
+# Batch tool descriptions
+BATCH_EXECUTE_DESC = """Run several tools in one request and return all results together.
+
+Operations run concurrently (bounded by max_concurrent) and each one gets its
+own timeout, so a fleet-wide refresh costs one round-trip instead of many.
+
+Parameters:
+operations* - List of {"tool": "<tool name>", "args": {...}} entries
+max_concurrent - Maximum operations running at once (optional, default: 8)
+stop_on_error - Skip operations that have not started after a failure (optional, default: false)
+timeout_ms - Per-operation timeout in milliseconds (optional, default: 30000)
+
+Example:
+[{"id": 0, "ok": true, "result": "...", "error": null}]"""
@@ -3,23 +3,109 @@ VM-related tools for Proxmox MCP.
 
 This module provides tools for managing and interacting with Proxmox VMs:
 - Listing all VMs across the cluster with their status
+- Fetching status for many VMs concurrently
 - Retrieving detailed VM information including:
   * Resource allocation (CPU, memory)
   * Runtime status
   * Node placement
 - Executing commands within VMs via QEMU guest agent
 - Handling VM console operations
-- VM power management (start, stop, shutdown, reset)
+- VM power management (start, stop, shutdown, reset), singly or for
+  several VMs in parallel
 - VM creation with customizable specifications
 
 The tools implement fallback mechanisms for scenarios where
 detailed VM information might be temporarily unavailable.
 """
-from typing import List, Optional
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from mcp.types import TextContent as Content
+from proxmoxer.core import ResourceException
+from requests.exceptions import RequestException
 from .base import ProxmoxTool
 from .definitions import GET_VMS_DESC, EXECUTE_VM_COMMAND_DESC
 from .console.manager import VMConsoleManager
+from ..core.proxmox import POOL_MAXSIZE
+from ..formatting import ProxmoxFormatters
+from ..utils.cache import TTLCache
+
+# Allowed ranges for create_vm resources (inclusive)
+CPU_RANGE = (1, 32)
+MEMORY_RANGE_MB = (512, 131072)
+DISK_RANGE_GB = (5, 1000)
+
+# The guest agent serializes commands per VM; more than this just queues up
+MAX_COMMANDS_PER_VM = 2
+
+# Side-effect free commands whose output may be reused for a few seconds.
+# Anything chaining or redirecting through the shell is never cached.
+READ_ONLY_COMMAND = re.compile(
+    r"^(uname( -[a-z]+)*|uptime( -[a-z]+)*|hostname( -[fsdiIA])?|cat /proc/[\w/.-]+)$"
+)
+COMMAND_CACHE_TTL = 10.0
+
+# Storage type -> (disk format, supports a cloud-init drive)
+_STORAGE_PROFILES = {
+    "lvm": ("raw", False),
+    "lvmthin": ("raw", False),
+    "dir": ("qcow2", True),
+    "nfs": ("qcow2", True),
+    "cifs": ("qcow2", True),
+}
+# Unknown storage types get raw disks and no cloud-init drive
+_DEFAULT_STORAGE_PROFILE = ("raw", False)
+
+# How long a node's storage listing is reused by create_vm
+STORAGE_CACHE_TTL = 30.0
+
+# How long the cluster-wide VM ID listing is reused by create_vm
+VMID_CACHE_TTL = 5.0
+
+# Lowercase fragments of Proxmox errors meaning the VM does not exist
+_NOT_FOUND_MARKERS = ("does not exist", "not found")
+
+# Power actions: status that makes the action a no-op, message when
+# skipped, message when the action was issued
+_POWER_ACTIONS = {
+    "start": ("running", "🟢 VM {vmid} is already running",
+              "🚀 VM {vmid} start initiated successfully"),
+    "stop": ("stopped", "🔴 VM {vmid} is already stopped",
+             "🛑 VM {vmid} stop initiated successfully"),
+    "shutdown": ("stopped", "🔴 VM {vmid} is already stopped",
+                 "💤 VM {vmid} graceful shutdown initiated"),
+    "reset": ("stopped", "⚠️ Cannot reset VM {vmid}: VM is currently stopped\nUse start_vm to start it first",
+              "🔄 VM {vmid} reset initiated successfully"),
+}
+
+# Parallel per-VM requests; never more than the HTTP pool can keep alive
+MAX_FETCH_WORKERS = min(16, POOL_MAXSIZE)
+
+def _validate_vm_params(cpus: int, memory: int, disk_size: int) -> None:
+    """Check create_vm resource sizes against their allowed ranges.
+
+    Args:
+        cpus: Number of CPU cores
+        memory: Memory size in MB
+        disk_size: Disk size in GB
+
+    Raises:
+        ValueError: Naming every parameter that is out of range
+    """
+    if (CPU_RANGE[0] <= cpus <= CPU_RANGE[1]
+            and MEMORY_RANGE_MB[0] <= memory <= MEMORY_RANGE_MB[1]
+            and DISK_RANGE_GB[0] <= disk_size <= DISK_RANGE_GB[1]):
+        return
+
+    errors = []
+    if not CPU_RANGE[0] <= cpus <= CPU_RANGE[1]:
+        errors.append(f"cpus must be between {CPU_RANGE[0]} and {CPU_RANGE[1]}")
+    if not MEMORY_RANGE_MB[0] <= memory <= MEMORY_RANGE_MB[1]:
+        errors.append(f"memory must be between {MEMORY_RANGE_MB[0]} and {MEMORY_RANGE_MB[1]} MB")
+    if not DISK_RANGE_GB[0] <= disk_size <= DISK_RANGE_GB[1]:
+        errors.append(f"disk_size must be between {DISK_RANGE_GB[0]} and {DISK_RANGE_GB[1]} GB")
+    raise ValueError("Invalid VM parameters: " + "; ".join(errors))
 
 class VMTools(ProxmoxTool):
     """Tools for managing Proxmox VMs.
@@ -45,8 +131,12 @@ class VMTools(ProxmoxTool):
         """
         super().__init__(proxmox_api)
         self.console_manager = VMConsoleManager(proxmox_api)
+        self._command_slots: Dict[Tuple[str, str], asyncio.Semaphore] = {}
+        self._command_cache = TTLCache(maxsize=128, ttl=COMMAND_CACHE_TTL)
+        self._storage_cache = TTLCache(maxsize=64, ttl=STORAGE_CACHE_TTL)
+        self._vmid_cache = TTLCache(maxsize=1, ttl=VMID_CACHE_TTL)
 
-    def get_vms(self) -> List[Content]:
+    def get_vms(self, detailed: bool = False) -> List[Content]:
         """List all virtual machines across the cluster with detailed status.
 
         Retrieves comprehensive information for each VM including:
@@ -57,8 +147,15 @@ class VMTools(ProxmoxTool):
           * Memory allocation and usage
         - Node placement
         
-        Implements a fallback mechanism that returns basic information
-        if detailed configuration retrieval fails for any VM.
+        By default the whole list comes from a single /cluster/resources
+        query. With detailed=True, or if that query is unavailable, VMs are
+        listed per node and each VM's config is read for its core count,
+        falling back to basic information if a config cannot be retrieved.
+        The config reads run in parallel on a small thread pool.
+
+        Args:
+            detailed: Read CPU cores from each VM's config instead of the
+                     cluster-wide summary (one extra request per VM)
 
         Returns:
             List of Content objects containing formatted VM information:
@@ -78,43 +175,163 @@ class VMTools(ProxmoxTool):
             RuntimeError: If the cluster-wide VM query fails
         """
         try:
-            result = []
-            for node in self.proxmox.nodes.get():
+            if not detailed:
+                try:
+                    resources = self.proxmox.cluster.resources.get(type="vm")
+                except Exception as e:
+                    self.logger.warning(f"Cluster resources unavailable, listing VMs per node: {e}")
+                else:
+                    # type=vm also matches LXC containers; entries are
+                    # built as the formatter consumes them
+                    result = (
+                        self._vm_entry(vm, vm["node"], vm.get("maxcpu", "N/A"))
+                        for vm in resources
+                        if vm.get("type") == "qemu"
+                    )
+                    return self._format_response(result, "vms")
+
+            nodes = self.proxmox.nodes
+            listed = []
+            for node in nodes.get():
                 node_name = node["node"]
-                vms = self.proxmox.nodes(node_name).qemu.get()
-                for vm in vms:
-                    vmid = vm["vmid"]
-                    # Get VM config for CPU cores
+                qemu = nodes(node_name).qemu
+                for vm in qemu.get():
+                    listed.append((node_name, qemu, vm))
+            if not listed:
+                return self._format_response([], "vms")
+
+            # Get VM configs for CPU cores, one request per VM in parallel
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(listed))) as executor:
+                futures = [
+                    executor.submit(qemu(vm["vmid"]).config.get)
+                    for _, qemu, vm in listed
+                ]
+
+            def entries():
+                for (node_name, _, vm), future in zip(listed, futures):
                     try:
-                        config = self.proxmox.nodes(node_name).qemu(vmid).config.get()
-                        result.append({
-                            "vmid": vmid,
-                            "name": vm["name"],
-                            "status": vm["status"],
-                            "node": node_name,
-                            "cpus": config.get("cores", "N/A"),
-                            "memory": {
-                                "used": vm.get("mem", 0),
-                                "total": vm.get("maxmem", 0)
-                            }
-                        })
-                    except Exception:
+                        cpus = future.result().get("cores", "N/A")
+                    except (ResourceException, RequestException):
                         # Fallback if can't get config
-                        result.append({
-                            "vmid": vmid,
-                            "name": vm["name"],
-                            "status": vm["status"],
-                            "node": node_name,
-                            "cpus": "N/A",
-                            "memory": {
-                                "used": vm.get("mem", 0),
-                                "total": vm.get("maxmem", 0)
-                            }
-                        })
-            return self._format_response(result, "vms")
+                        self.logger.debug("config fetch failed for vmid=%s", vm["vmid"])
+                        cpus = "N/A"
+                    yield self._vm_entry(vm, node_name, cpus)
+
+            return self._format_response(entries(), "vms")
         except Exception as e:
             self._handle_error("get VMs", e)
 
+    async def get_vms_async(self, detailed: bool = False) -> List[Content]:
+        """Async variant of get_vms for callers running an event loop.
+
+        Runs get_vms in a worker thread so the blocking HTTP calls do not
+        stall the loop.
+
+        Args:
+            detailed: Read CPU cores from each VM's config (see get_vms)
+
+        Returns:
+            List of Content objects containing formatted VM information
+        """
+        return await asyncio.to_thread(self.get_vms, detailed)
+
+    @staticmethod
+    def _vm_entry(vm: dict, node: str, cpus) -> dict:
+        """Build a get_vms result entry from a VM listing entry."""
+        return {
+            "vmid": vm["vmid"],
+            "name": vm.get("name", f"VM-{vm['vmid']}"),
+            "status": vm["status"],
+            "node": node,
+            "cpus": cpus,
+            "memory": {
+                "used": vm.get("mem", 0),
+                "total": vm.get("maxmem", 0)
+            }
+        }
+
+    async def get_vms_bulk(self, node: str, vmids: List[str]) -> List[Content]:
+        """Get current status for several VMs on one node concurrently.
+
+        Issues one status query per VM, all in flight at the same time, so
+        the total wait is roughly one round-trip instead of one per VM.
+        VMs whose status cannot be retrieved are listed with status
+        "unknown" rather than failing the whole call.
+
+        Args:
+            node: Host node name (e.g., 'pve')
+            vmids: VM ID numbers (e.g., ['100', '101'])
+
+        Returns:
+            List of Content objects containing formatted VM information,
+            in the same shape as get_vms
+
+        Raises:
+            RuntimeError: If the request cannot be issued at all
+        """
+        try:
+            qemu = self.proxmox.nodes(node).qemu
+            statuses = await asyncio.gather(
+                *(asyncio.to_thread(qemu(vmid).status.current.get) for vmid in vmids),
+                return_exceptions=True
+            )
+
+            result = []
+            for vmid, status in zip(vmids, statuses):
+                if isinstance(status, BaseException):
+                    self.logger.warning(f"Failed to get status for VM {vmid}: {status}")
+                    status = {"name": f"VM-{vmid}", "status": "unknown"}
+                result.append({
+                    "vmid": vmid,
+                    "name": status.get("name", f"VM-{vmid}"),
+                    "status": status.get("status", "unknown"),
+                    "node": node,
+                    "cpus": status.get("cpus", "N/A"),
+                    "memory": {
+                        "used": status.get("mem", 0),
+                        "total": status.get("maxmem", 0)
+                    }
+                })
+            return self._format_response(result, "vms")
+        except Exception as e:
+            self._handle_error(f"get status for VMs on node {node}", e)
+
+    def _get_storage_list(self, node: str, refresh: bool = False) -> List[dict]:
+        """Get a node's storage listing, reusing it for STORAGE_CACHE_TTL seconds.
+
+        Args:
+            node: Host node name (e.g., 'pve')
+            refresh: Bypass the cached listing and fetch a fresh one
+
+        Returns:
+            Storage entries as returned by /nodes/{node}/storage
+        """
+        if not refresh:
+            storage_list = self._storage_cache.get(node)
+            if storage_list is not None:
+                return storage_list
+        storage_list = self.proxmox.nodes(node).storage.get()
+        self._storage_cache.set(node, storage_list)
+        return storage_list
+
+    def _get_used_vmids(self) -> Dict[str, str]:
+        """Map every VM and container ID in the cluster to its node.
+
+        Read from /cluster/resources and reused for VMID_CACHE_TTL seconds.
+        IDs are unique across QEMU VMs and LXC containers, so both count.
+
+        Returns:
+            Dictionary of vmid (as string) to node name
+        """
+        used = self._vmid_cache.get("vmids")
+        if used is None:
+            used = {
+                str(r["vmid"]): r.get("node", "")
+                for r in self.proxmox.cluster.resources.get(type="vm")
+            }
+            self._vmid_cache.set("vmids", used)
+        return used
+
     def create_vm(self, node: str, vmid: str, name: str, cpus: int, memory: int, 
                   disk_size: int, storage: Optional[str] = None, ostype: Optional[str] = None) -> List[Content]:
         """Create a new virtual machine with specified configuration.
@@ -133,75 +350,57 @@ class VMTools(ProxmoxTool):
             List of Content objects containing creation result
             
         Raises:
-            ValueError: If VM ID already exists or invalid parameters
+            ValueError: If VM ID already exists or cpus/memory/disk_size are out of range
             RuntimeError: If VM creation fails
         """
+        _validate_vm_params(cpus, memory, disk_size)
+        
         try:
-            # Check if VM ID already exists
-            try:
-                existing_vm = self.proxmox.nodes(node).qemu(vmid).config.get()
-                raise ValueError(f"VM {vmid} already exists on node {node}")
-            except Exception as e:
-                if "does not exist" not in str(e).lower():
-                    raise e
-            
-            # Get storage information
-            storage_list = self.proxmox.nodes(node).storage.get()
-            storage_info = {}
-            for s in storage_list:
-                storage_info[s["storage"]] = s
+            # Check if VM ID already exists anywhere in the cluster
+            used_vmids = self._get_used_vmids()
+            if str(vmid) in used_vmids:
+                raise ValueError(f"VM {vmid} already exists on node {used_vmids[str(vmid)]}")
+            
+            # Get storage information (cached briefly per node)
+            storage_info = {s["storage"]: s for s in self._get_storage_list(node)}
+            if storage is not None and storage not in storage_info:
+                # Storage may have been added since the listing was cached
+                storage_info = {s["storage"]: s for s in self._get_storage_list(node, refresh=True)}
+            
+            # Storages whose comma-separated content list includes VM images
+            images_capable = {
+                name for name, s in storage_info.items()
+                if "images" in s.get("content", "").split(",")
+            }
             
-            # Auto-detect storage if not specified
+            # Auto-detect storage if not specified: prefer local-lvm, then
+            # vm-storage, then the first listed storage that supports images
             if storage is None:
-                # Prefer local-lvm for VM images first
-                for s in storage_list:
-                    if s["storage"] == "local-lvm" and "images" in s.get("content", ""):
-                        storage = s["storage"]
+                for preferred in ("local-lvm", "vm-storage"):
+                    if preferred in images_capable:
+                        storage = preferred
                         break
+                else:
+                    storage = next((name for name in storage_info if name in images_capable), None)
                 if storage is None:
-                    # Then try vm-storage 
-                    for s in storage_list:
-                        if s["storage"] == "vm-storage" and "images" in s.get("content", ""):
-                            storage = s["storage"]
-                            break
-                if storage is None:
-                    # Fallback to any storage that supports images
-                    for s in storage_list:
-                        if "images" in s.get("content", ""):
-                            storage = s["storage"]
-                            break
-                    if storage is None:
-                        raise ValueError("No suitable storage found for VM images")
+                    raise ValueError("No suitable storage found for VM images")
             
             # Validate storage exists and supports images
             if storage not in storage_info:
                 raise ValueError(f"Storage '{storage}' not found on node {node}")
             
-            if "images" not in storage_info[storage].get("content", ""):
+            if storage not in images_capable:
                 raise ValueError(f"Storage '{storage}' does not support VM images")
             
             # Determine appropriate disk format based on storage type
             storage_type = storage_info[storage]["type"]
+            disk_format, needs_cloudinit = _STORAGE_PROFILES.get(storage_type, _DEFAULT_STORAGE_PROFILE)
             
-            if storage_type in ["lvm", "lvmthin"]:
-                # LVM storages use raw format and no cloudinit
-                disk_format = "raw"
-                vm_config_storage = {
-                    "scsi0": f"{storage}:{disk_size},format={disk_format}",
-                }
-            elif storage_type in ["dir", "nfs", "cifs"]:
-                # File-based storages can use qcow2
-                disk_format = "qcow2"
-                vm_config_storage = {
-                    "scsi0": f"{storage}:{disk_size},format={disk_format}",
-                    "ide2": f"{storage}:cloudinit",
-                }
-            else:
-                # Default to raw for unknown storage types
-                disk_format = "raw"
-                vm_config_storage = {
-                    "scsi0": f"{storage}:{disk_size},format={disk_format}",
-                }
+            vm_config_storage = {
+                "scsi0": f"{storage}:{disk_size},format={disk_format}",
+            }
+            if needs_cloudinit:
+                vm_config_storage["ide2"] = f"{storage}:cloudinit"
             
             # Set default OS type
             if ostype is None:
@@ -226,78 +425,147 @@ class VMTools(ProxmoxTool):
             
             # Create the VM
             task_result = self.proxmox.nodes(node).qemu.create(**vm_config)
-            
-            cloudinit_note = ""
-            if storage_type in ["lvm", "lvmthin"]:
-                cloudinit_note = "\n  ⚠️  Note: LVM storage doesn't support cloud-init image"
-            
-            result_text = f"""🎉 VM {vmid} created successfully!
-
-📋 VM Configuration:
-  • Name: {name}
-  • Node: {node}
-  • VM ID: {vmid}
-  • CPU Cores: {cpus}
-  • Memory: {memory} MB ({memory/1024:.1f} GB)
-  • Disk: {disk_size} GB ({storage}, {disk_format} format)
-  • Storage Type: {storage_type}
-  • OS Type: {ostype}
-  • Network: virtio (bridge=vmbr0)
-  • QEMU Agent: Enabled{cloudinit_note}
-
-🔧 Task ID: {task_result}
-
-💡 Next steps:
-  1. Upload an ISO to install the operating system
-  2. Start the VM using start_vm tool
-  3. Access the console to complete OS installation"""
+            self._vmid_cache.clear()
+            
+            lines = [
+                f"🎉 VM {vmid} created successfully!",
+                "",
+                "📋 VM Configuration:",
+                f"  • Name: {name}",
+                f"  • Node: {node}",
+                f"  • VM ID: {vmid}",
+                f"  • CPU Cores: {cpus}",
+                f"  • Memory: {memory} MB ({memory/1024:.1f} GB)",
+                f"  • Disk: {disk_size} GB ({storage}, {disk_format} format)",
+                f"  • Storage Type: {storage_type}",
+                f"  • OS Type: {ostype}",
+                "  • Network: virtio (bridge=vmbr0)",
+                "  • QEMU Agent: Enabled",
+            ]
+            if storage_type in ("lvm", "lvmthin"):
+                lines.append("  ⚠️  Note: LVM storage doesn't support cloud-init image")
+            lines += [
+                "",
+                f"🔧 Task ID: {task_result}",
+                "",
+                "💡 Next steps:",
+                "  1. Upload an ISO to install the operating system",
+                "  2. Start the VM using start_vm tool",
+                "  3. Access the console to complete OS installation",
+            ]
+            result_text = "\n".join(lines)
             
             return [Content(type="text", text=result_text)]
             
         except ValueError as e:
             raise e
         except Exception as e:
+            if "storage" in str(e).lower():
+                # The cached listing may be stale; re-read it next time
+                self._storage_cache.pop(node)
             self._handle_error(f"create VM {vmid}", e)
 
-    def start_vm(self, node: str, vmid: str) -> List[Content]:
-        """Start a virtual machine.
-        
+    def _raise_if_missing(self, error: Exception, node: str, vmid: str) -> None:
+        """Turn a Proxmox "VM does not exist" error into a ValueError.
+
+        Raises:
+            ValueError: If the error says the VM does not exist
+        """
+        message = str(error).lower()
+        if any(marker in message for marker in _NOT_FOUND_MARKERS):
+            raise ValueError(f"VM {vmid} not found on node {node}") from error
+
+    def _forget_command_output(self, node: str, vmid: str) -> None:
+        """Drop cached command output for a VM whose state is changing."""
+        self._command_cache.discard_if(lambda key: key[:2] == (node, vmid))
+
+    def _power_op(self, node: str, vmid: str, action: str,
+                  current_status: Optional[str] = None) -> List[Content]:
+        """Run a power action from _POWER_ACTIONS against a VM.
+
+        Reads the VM's current status once (unless the caller already knows
+        it) and skips the action if the VM is already in the state the
+        action would leave it in (or, for reset, cannot be applied in).
+
         Args:
             node: Host node name (e.g., 'pve1', 'proxmox-node2')
             vmid: VM ID number (e.g., '100', '101')
-            
+            action: Key of _POWER_ACTIONS ('start', 'stop', 'shutdown', 'reset')
+            current_status: Known current status ('running', 'stopped'),
+                          saves the status request when given
+
         Returns:
             List of Content objects containing operation result
-            
+
         Raises:
             ValueError: If VM is not found
-            RuntimeError: If start operation fails
+            RuntimeError: If the power operation fails
         """
+        skip_status, skip_text, done_text = _POWER_ACTIONS[action]
         try:
-            # Check if VM exists and get current status
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
-            current_status = vm_status.get("status")
+            vm_status = self.proxmox.nodes(node).qemu(vmid).status
+            if current_status is None:
+                # Check if VM exists and get current status
+                current_status = vm_status.current.get().get("status")
             
-            if current_status == "running":
-                result_text = f"🟢 VM {vmid} is already running"
+            if current_status == skip_status:
+                result_text = skip_text.format(vmid=vmid)
             else:
-                # Start the VM
-                task_result = self.proxmox.nodes(node).qemu(vmid).status.start.post()
-                result_text = f"🚀 VM {vmid} start initiated successfully\nTask ID: {task_result}"
+                self._forget_command_output(node, vmid)
+                task_result = getattr(vm_status, action).post()
+                result_text = f"{done_text.format(vmid=vmid)}\nTask ID: {task_result}"
                 
             return [Content(type="text", text=result_text)]
             
         except Exception as e:
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
-                raise ValueError(f"VM {vmid} not found on node {node}")
-            self._handle_error(f"start VM {vmid}", e)
+            self._raise_if_missing(e, node, vmid)
+            self._handle_error(f"{action} VM {vmid}", e)
+
+    async def power_op_async(self, node: str, vmid: str, action: str) -> List[Content]:
+        """Async variant of the power operations for callers running an event loop.
+
+        Runs the blocking status check and action in a worker thread.
+
+        Args:
+            node: Host node name (e.g., 'pve1', 'proxmox-node2')
+            vmid: VM ID number (e.g., '100', '101')
+            action: 'start', 'stop', 'shutdown' or 'reset'
 
-    def stop_vm(self, node: str, vmid: str) -> List[Content]:
+        Returns:
+            List of Content objects containing operation result
+
+        Raises:
+            ValueError: If the action is unknown or the VM is not found
+            RuntimeError: If the power operation fails
+        """
+        if action not in _POWER_ACTIONS:
+            raise ValueError(f"Unknown power action {action!r}; expected one of {', '.join(_POWER_ACTIONS)}")
+        return await asyncio.to_thread(self._power_op, node, vmid, action)
+
+    def start_vm(self, node: str, vmid: str, current_status: Optional[str] = None) -> List[Content]:
+        """Start a virtual machine.
+        
+        Args:
+            node: Host node name (e.g., 'pve1', 'proxmox-node2')
+            vmid: VM ID number (e.g., '100', '101')
+            current_status: Known current status, skips the status request if given
+            
+        Returns:
+            List of Content objects containing operation result
+            
+        Raises:
+            ValueError: If VM is not found
+            RuntimeError: If start operation fails
+        """
+        return self._power_op(node, vmid, "start", current_status)
+
+    def stop_vm(self, node: str, vmid: str, current_status: Optional[str] = None) -> List[Content]:
         """Stop a virtual machine (force stop).
         
         Args:
             node: Host node name (e.g., 'pve1', 'proxmox-node2') 
             vmid: VM ID number (e.g., '100', '101')
+            current_status: Known current status, skips the status request if given
             
         Returns:
             List of Content objects containing operation result
@@ -306,31 +574,15 @@ class VMTools(ProxmoxTool):
             ValueError: If VM is not found
             RuntimeError: If stop operation fails
         """
-        try:
-            # Check if VM exists and get current status
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
-            current_status = vm_status.get("status")
-            
-            if current_status == "stopped":
-                result_text = f"🔴 VM {vmid} is already stopped"
-            else:
-                # Stop the VM
-                task_result = self.proxmox.nodes(node).qemu(vmid).status.stop.post()
-                result_text = f"🛑 VM {vmid} stop initiated successfully\nTask ID: {task_result}"
-                
-            return [Content(type="text", text=result_text)]
-            
-        except Exception as e:
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
-                raise ValueError(f"VM {vmid} not found on node {node}")
-            self._handle_error(f"stop VM {vmid}", e)
+        return self._power_op(node, vmid, "stop", current_status)
 
-    def shutdown_vm(self, node: str, vmid: str) -> List[Content]:
+    def shutdown_vm(self, node: str, vmid: str, current_status: Optional[str] = None) -> List[Content]:
         """Shutdown a virtual machine gracefully.
         
         Args:
             node: Host node name (e.g., 'pve1', 'proxmox-node2')
             vmid: VM ID number (e.g., '100', '101')
+            current_status: Known current status, skips the status request if given
             
         Returns:
             List of Content objects containing operation result
@@ -339,31 +591,15 @@ class VMTools(ProxmoxTool):
             ValueError: If VM is not found
             RuntimeError: If shutdown operation fails
         """
-        try:
-            # Check if VM exists and get current status
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
-            current_status = vm_status.get("status")
-            
-            if current_status == "stopped":
-                result_text = f"🔴 VM {vmid} is already stopped"
-            else:
-                # Shutdown the VM gracefully
-                task_result = self.proxmox.nodes(node).qemu(vmid).status.shutdown.post()
-                result_text = f"💤 VM {vmid} graceful shutdown initiated\nTask ID: {task_result}"
-                
-            return [Content(type="text", text=result_text)]
-            
-        except Exception as e:
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
-                raise ValueError(f"VM {vmid} not found on node {node}")
-            self._handle_error(f"shutdown VM {vmid}", e)
+        return self._power_op(node, vmid, "shutdown", current_status)
 
-    def reset_vm(self, node: str, vmid: str) -> List[Content]:
+    def reset_vm(self, node: str, vmid: str, current_status: Optional[str] = None) -> List[Content]:
         """Reset (restart) a virtual machine.
         
         Args:
             node: Host node name (e.g., 'pve1', 'proxmox-node2')
             vmid: VM ID number (e.g., '100', '101')
+            current_status: Known current status, skips the status request if given
             
         Returns:
             List of Content objects containing operation result
@@ -372,24 +608,143 @@ class VMTools(ProxmoxTool):
             ValueError: If VM is not found
             RuntimeError: If reset operation fails
         """
+        return self._power_op(node, vmid, "reset", current_status)
+
+    def _get_vm_statuses(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Map (node, vmid) of every QEMU VM to its status and name in one request.
+
+        Returns:
+            Dictionary keyed by (node, vmid as string) of {"status", "name"};
+            empty if the cluster-wide query fails, so callers fall back to
+            per-VM checks
+        """
         try:
-            # Check if VM exists and get current status
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
-            current_status = vm_status.get("status")
-            
-            if current_status == "stopped":
-                result_text = f"⚠️ Cannot reset VM {vmid}: VM is currently stopped\nUse start_vm to start it first"
-            else:
-                # Reset the VM
-                task_result = self.proxmox.nodes(node).qemu(vmid).status.reset.post()
-                result_text = f"🔄 VM {vmid} reset initiated successfully\nTask ID: {task_result}"
-                
-            return [Content(type="text", text=result_text)]
-            
-        except Exception as e:
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
-                raise ValueError(f"VM {vmid} not found on node {node}")
-            self._handle_error(f"reset VM {vmid}", e)
+            resources = self.proxmox.cluster.resources.get(type="vm")
+        except (ResourceException, RequestException) as e:
+            self.logger.warning(f"Cluster resources unavailable, checking VM status individually: {e}")
+            return {}
+        return {
+            (r["node"], str(r["vmid"])): {"status": r["status"], "name": r.get("name")}
+            for r in resources
+            if r.get("type") == "qemu"
+        }
+
+    def _run_many(self, targets: List[Tuple[str, str]],
+                  operation: Callable[[str, str, Optional[Dict[str, Any]]], List[Content]],
+                  label: str) -> List[Content]:
+        """Apply a per-VM operation to several VMs in parallel.
+
+        All current statuses and names are read with one cluster-wide
+        request up front and passed to each operation, so the per-VM
+        status requests are skipped.
+
+        Args:
+            targets: (node, vmid) pairs
+            operation: Per-VM callable taking (node, vmid, vm), where vm is
+                      {"status", "name"} or None if the VM was not listed
+            label: Operation name used in failure lines (e.g. 'start')
+
+        Returns:
+            A single Content object with one result line per target, in
+            the order given. Failures are reported inline instead of
+            aborting the remaining operations.
+        """
+        if not targets:
+            return [Content(type="text", text="No VMs given")]
+
+        statuses = self._get_vm_statuses()
+
+        def run(target: Tuple[str, str]) -> str:
+            node, vmid = target
+            try:
+                contents = operation(node, vmid, statuses.get((node, str(vmid))))
+                return "\n".join(content.text for content in contents)
+            except Exception as e:
+                return f"❌ Failed to {label} VM {vmid} on node {node}: {e}"
+
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(targets))) as executor:
+            lines = list(executor.map(run, targets))
+        return [Content(type="text", text="\n\n".join(lines))]
+
+    def start_vms(self, targets: List[Tuple[str, str]]) -> List[Content]:
+        """Start several VMs in parallel.
+
+        Args:
+            targets: (node, vmid) pairs (e.g., [('pve', '100'), ('pve', '101')])
+
+        Returns:
+            List of Content objects containing one result line per VM
+        """
+        return self._run_many(
+            targets,
+            lambda node, vmid, vm: self.start_vm(node, vmid, vm and vm["status"]),
+            "start"
+        )
+
+    def stop_vms(self, targets: List[Tuple[str, str]]) -> List[Content]:
+        """Force stop several VMs in parallel.
+
+        Args:
+            targets: (node, vmid) pairs (e.g., [('pve', '100'), ('pve', '101')])
+
+        Returns:
+            List of Content objects containing one result line per VM
+        """
+        return self._run_many(
+            targets,
+            lambda node, vmid, vm: self.stop_vm(node, vmid, vm and vm["status"]),
+            "stop"
+        )
+
+    def shutdown_vms(self, targets: List[Tuple[str, str]]) -> List[Content]:
+        """Gracefully shut down several VMs in parallel.
+
+        Args:
+            targets: (node, vmid) pairs (e.g., [('pve', '100'), ('pve', '101')])
+
+        Returns:
+            List of Content objects containing one result line per VM
+        """
+        return self._run_many(
+            targets,
+            lambda node, vmid, vm: self.shutdown_vm(node, vmid, vm and vm["status"]),
+            "shutdown"
+        )
+
+    def reset_vms(self, targets: List[Tuple[str, str]]) -> List[Content]:
+        """Reset several VMs in parallel.
+
+        Args:
+            targets: (node, vmid) pairs (e.g., [('pve', '100'), ('pve', '101')])
+
+        Returns:
+            List of Content objects containing one result line per VM
+        """
+        return self._run_many(
+            targets,
+            lambda node, vmid, vm: self.reset_vm(node, vmid, vm and vm["status"]),
+            "reset"
+        )
+
+    def delete_vms(self, targets: List[Tuple[str, str]], force: bool = False) -> List[Content]:
+        """Delete several VMs in parallel.
+
+        WARNING: This operation cannot be undone!
+
+        Args:
+            targets: (node, vmid) pairs (e.g., [('pve', '100'), ('pve', '101')])
+            force: Stop running VMs before deleting them
+
+        Returns:
+            List of Content objects containing one result line per VM
+        """
+        return self._run_many(
+            targets,
+            lambda node, vmid, vm: self.delete_vm(
+                node, vmid, force, vm and vm["status"], vm and vm["name"]
+            ),
+            "delete"
+        )
 
     async def execute_command(self, node: str, vmid: str, command: str) -> List[Content]:
         """Execute a command in a VM via QEMU guest agent.
@@ -400,6 +755,10 @@ class VMTools(ProxmoxTool):
         - QEMU guest agent must be installed and running in the VM
         - Command execution permissions must be enabled
 
+        At most MAX_COMMANDS_PER_VM commands run against the same VM at
+        once. Successful output of read-only commands (uname, uptime,
+        hostname, cat /proc/...) is reused for COMMAND_CACHE_TTL seconds.
+
         Args:
             node: Host node name (e.g., 'pve1', 'proxmox-node2')
             vmid: VM ID number (e.g., '100', '101')
@@ -417,21 +776,38 @@ class VMTools(ProxmoxTool):
             ValueError: If VM is not found, not running, or guest agent is not available
             RuntimeError: If command execution fails due to permissions or other issues
         """
+        cacheable = READ_ONLY_COMMAND.match(command.strip()) is not None
+        key = (node, vmid, command.strip())
+        if cacheable:
+            cached = self._command_cache.get(key)
+            if cached is not None:
+                return cached
+
         try:
-            result = await self.console_manager.execute_command(node, vmid, command)
+            slot = self._command_slots.get((node, vmid))
+            if slot is None:
+                slot = self._command_slots.setdefault(
+                    (node, vmid), asyncio.Semaphore(MAX_COMMANDS_PER_VM)
+                )
+            async with slot:
+                result = await self.console_manager.execute_command(node, vmid, command)
             # Use the command output formatter from ProxmoxFormatters
-            from ..formatting import ProxmoxFormatters
             formatted = ProxmoxFormatters.format_command_output(
                 success=result["success"],
                 command=command,
                 output=result["output"],
                 error=result.get("error")
             )
-            return [Content(type="text", text=formatted)]
+            response = [Content(type="text", text=formatted)]
+            if cacheable and result["success"]:
+                self._command_cache.set(key, response)
+            return response
         except Exception as e:
             self._handle_error(f"execute command on VM {vmid}", e)
 
-    def delete_vm(self, node: str, vmid: str, force: bool = False) -> List[Content]:
+    def delete_vm(self, node: str, vmid: str, force: bool = False,
+                  current_status: Optional[str] = None,
+                  vm_name: Optional[str] = None) -> List[Content]:
         """Delete/remove a virtual machine completely.
         
         This will permanently delete the VM and all its associated data including:
@@ -445,6 +821,9 @@ class VMTools(ProxmoxTool):
             node: Host node name (e.g., 'pve1', 'proxmox-node2')
             vmid: VM ID number (e.g., '100', '101')
             force: Force deletion even if VM is running (will stop first)
+            current_status: Known current status, skips the status request if
+                          given (the VM name is then taken from vm_name)
+            vm_name: Known VM name, used with current_status
             
         Returns:
             List of Content objects containing deletion result
@@ -454,15 +833,20 @@ class VMTools(ProxmoxTool):
             RuntimeError: If deletion fails
         """
         try:
-            # Check if VM exists and get current status
-            try:
-                vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
-                current_status = vm_status.get("status")
-                vm_name = vm_status.get("name", f"VM-{vmid}")
-            except Exception as e:
-                if "does not exist" in str(e).lower() or "not found" in str(e).lower():
-                    raise ValueError(f"VM {vmid} not found on node {node}")
-                raise e
+            vm_resource = self.proxmox.nodes(node).qemu(vmid)
+            
+            vm_name = vm_name or f"VM-{vmid}"
+            if current_status is None:
+                # Check if VM exists and get current status
+                try:
+                    vm_status = vm_resource.status.current.get()
+                    current_status = vm_status.get("status")
+                    vm_name = vm_status.get("name", vm_name)
+                except Exception as e:
+                    self._raise_if_missing(e, node, vmid)
+                    raise e
+            
+            self._forget_command_output(node, vmid)
             
             # Check if VM is running
             if current_status == "running":
@@ -471,29 +855,32 @@ class VMTools(ProxmoxTool):
                                    f"Please stop it first or use force=True to stop and delete.")
                 else:
                     # Force stop the VM first
-                    self.proxmox.nodes(node).qemu(vmid).status.stop.post()
-                    result_text = f"🛑 Stopping VM {vmid} ({vm_name}) before deletion...\n"
+                    vm_resource.status.stop.post()
+                    first_line = f"🛑 Stopping VM {vmid} ({vm_name}) before deletion..."
             else:
-                result_text = f"🗑️ Deleting VM {vmid} ({vm_name})...\n"
+                first_line = f"🗑️ Deleting VM {vmid} ({vm_name})..."
             
             # Delete the VM
-            task_result = self.proxmox.nodes(node).qemu(vmid).delete()
-            
-            result_text += f"""🗑️ VM {vmid} ({vm_name}) deletion initiated successfully!
-
-⚠️ WARNING: This operation will permanently remove:
-  • VM configuration
-  • All virtual disks
-  • All snapshots
-  • Cannot be undone!
-
-🔧 Task ID: {task_result}
-
-✅ VM {vmid} ({vm_name}) is being deleted from node {node}"""
-            
-            return [Content(type="text", text=result_text)]
+            task_result = vm_resource.delete()
+            
+            lines = [
+                first_line,
+                f"🗑️ VM {vmid} ({vm_name}) deletion initiated successfully!",
+                "",
+                "⚠️ WARNING: This operation will permanently remove:",
+                "  • VM configuration",
+                "  • All virtual disks",
+                "  • All snapshots",
+                "  • Cannot be undone!",
+                "",
+                f"🔧 Task ID: {task_result}",
+                "",
+                f"✅ VM {vmid} ({vm_name}) is being deleted from node {node}",
+            ]
+            return [Content(type="text", text="\n".join(lines))]
             
         except ValueError as e:
             raise e
         except Exception as e:
+            self._raise_if_missing(e, node, vmid)
             self._handle_error(f"delete VM {vmid}", e)
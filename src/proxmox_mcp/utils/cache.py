@@ -0,0 +1,74 @@
+"""
+Caching utilities for the Proxmox MCP server.
+
+This module provides a small thread-safe time-to-live cache used to
+avoid repeating identical Proxmox API queries within a short window.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a fixed time-to-live.
+
+    Entries are evicted oldest-first once maxsize is reached. A ttl of
+    zero or less disables caching: set() becomes a no-op and every
+    lookup misses.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 5.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept at once
+            ttl: Lifetime of each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key for ttl seconds."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove key and return its value, or default if it was not cached."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def discard_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -2,43 +2,49 @@
 """
 Common configuration helper for test scripts
 """
+import functools
 import os
 import sys
 from pathlib import Path
 
+# Paths are fixed relative to this file, so compute them once at import
+PROJECT_ROOT = Path(__file__).parent.parent
+CONFIG_PATH = PROJECT_ROOT / "proxmox-config" / "config.json"
+SRC_PATH = PROJECT_ROOT / "src"
+
+# Config path returned by the first successful setup_test_environment()
+_SETUP_DONE = None
+
 def setup_test_environment():
-    """Set up test environment configuration paths"""
-    
-    # Get current script directory
-    current_dir = Path(__file__).parent
-    
-    # Calculate project root directory
-    project_root = current_dir.parent
-    
-    # Set configuration file path
-    config_path = project_root / "proxmox-config" / "config.json"
-    
-    # Set source code path
-    src_path = project_root / "src"
+    """Set up test environment configuration paths (only the first call does work)"""
+    global _SETUP_DONE
+    if _SETUP_DONE:
+        return _SETUP_DONE
     
     # Ensure paths exist
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file does not exist: {config_path}")
+    try:
+        os.stat(CONFIG_PATH)
+    except OSError as e:
+        raise FileNotFoundError(f"Configuration file does not exist: {CONFIG_PATH}") from e
     
-    if not src_path.exists():
-        raise FileNotFoundError(f"Source code directory does not exist: {src_path}")
+    try:
+        os.stat(SRC_PATH)
+    except OSError as e:
+        raise FileNotFoundError(f"Source code directory does not exist: {SRC_PATH}") from e
     
     # Set environment variables
-    os.environ['PROXMOX_MCP_CONFIG'] = str(config_path)
+    os.environ['PROXMOX_MCP_CONFIG'] = str(CONFIG_PATH)
     
     # Add source code path to Python path
-    if str(src_path) not in sys.path:
-        sys.path.insert(0, str(src_path))
+    if str(SRC_PATH) not in sys.path:
+        sys.path.insert(0, str(SRC_PATH))
     
-    return str(config_path)
+    _SETUP_DONE = str(CONFIG_PATH)
+    return _SETUP_DONE
 
+@functools.lru_cache(maxsize=1)
 def get_test_tools():
-    """Get test tools classes"""
+    """Get test tools classes (built once per process, so only one login and session)"""
     
     # Ensure environment is set up
     config_path = setup_test_environment()
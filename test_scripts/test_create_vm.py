@@ -2,25 +2,16 @@
 """
 Test VM creation functionality
 """
-import os
 import sys
+from test_common import get_test_tools
 
 def test_create_vm():
     """Test creating VM - 1 CPU, 2GB RAM, 10GB storage"""
     
-    # Set configuration
-    os.environ['PROXMOX_MCP_CONFIG'] = 'proxmox-config/config.json'
-    
     try:
-        from proxmox_mcp.config.loader import load_config
-        from proxmox_mcp.core.proxmox import ProxmoxManager
-        from proxmox_mcp.tools.vm import VMTools
-        
-        config = load_config('proxmox-config/config.json')
-        manager = ProxmoxManager(config.proxmox, config.auth)
-        api = manager.get_api()
-        
-        vm_tools = VMTools(api)
+        tools = get_test_tools()
+        api = tools['api']
+        vm_tools = tools['vm_tools']
         
         print("🎉 Test creating new VM - user requested configuration")
         print("=" * 60)
@@ -68,18 +59,8 @@ def test_create_vm():
 def test_list_vms():
     """Test listing VMs to confirm successful creation"""
     
-    os.environ['PROXMOX_MCP_CONFIG'] = 'proxmox-config/config.json'
-    
     try:
-        from proxmox_mcp.config.loader import load_config
-        from proxmox_mcp.core.proxmox import ProxmoxManager
-        from proxmox_mcp.tools.vm import VMTools
-        
-        config = load_config('proxmox-config/config.json')
-        manager = ProxmoxManager(config.proxmox, config.auth)
-        api = manager.get_api()
-        
-        vm_tools = VMTools(api)
+        vm_tools = get_test_tools()['vm_tools']
         
         print("\n🔍 List all VMs to confirm creation results:")
         print("=" * 40)
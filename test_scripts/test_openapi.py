@@ -3,43 +3,128 @@
 Test OpenAPI functionality
 """
 import requests
+import hashlib
 import json
 import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: the standard library is used without it
+    orjson = None
 
 # Get base URL from environment variable or use default localhost
 BASE_URL = os.getenv('OPENAPI_BASE_URL', 'http://localhost:8811')
 
-def test_basic_endpoints():
+# Cached copy of /openapi.json, reused for OPENAPI_SPEC_TTL seconds (0 disables)
+OPENAPI_SPEC_TTL = float(os.getenv('OPENAPI_SPEC_TTL', '300'))
+OPENAPI_CACHE_PATH = os.path.join(
+    tempfile.gettempdir(),
+    f"proxmox_openapi_{hashlib.sha256(BASE_URL.encode()).hexdigest()[:16]}.json"
+)
+
+# Set OPENAPI_TEST_FORCE=1 to send start_vm even if VM 101 is known to be running
+FORCE = os.getenv('OPENAPI_TEST_FORCE', '0') == '1'
+
+# Set OPENAPI_TEST_VERBOSE=1 to print full JSON responses instead of a summary
+VERBOSE = os.getenv('OPENAPI_TEST_VERBOSE', '0') == '1'
+
+# Proxmox task ID reported in create/power results
+TASK_ID_PATTERN = re.compile(r"Task ID: (\S+)")
+
+# VM statuses seen in this run's get_vms response, keyed by numeric vmid
+VM_STATE_CACHE = {}
+
+# "<name> (ID: 101)" followed by "• Status: RUNNING" in the formatted VM list
+VM_STATUS_PATTERN = re.compile(r"\(ID: (\d+)\)\s+• Status: (\w+)")
+
+# One session for every request so the connection is kept alive between tests.
+# Content-Type is added by requests for json= bodies, so only Accept is set here.
+SESSION = requests.Session()
+SESSION.headers["Accept"] = "application/json"
+
+# Retry transient failures on the pooled connections. Connection errors are
+# retried for any method (nothing was sent yet); gateway errors only for GET,
+# so create_vm/start_vm POSTs are never replayed.
+_RETRY = Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504], allowed_methods=["GET"])
+_ADAPTER = HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=_RETRY)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+def loads(data):
+    """Decode a JSON response body (bytes), with orjson when available"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def pretty_json(data):
+    """Indented JSON for display, with orjson when available"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def response_text(data):
+    """Get the tool output text from a decoded API response"""
+    if isinstance(data, list):
+        return "\n".join(item.get("text", "") if isinstance(item, dict) else str(item) for item in data)
+    if isinstance(data, str):
+        return data
+    return json.dumps(data, ensure_ascii=False)
+
+def parse_vm_states(data):
+    """Get {vmid: status} from a decoded get_vms response (formatted VM list text)"""
+    text = response_text(data)
+    return {int(vmid): status.lower() for vmid, status in VM_STATUS_PATTERN.findall(text)}
+
+def summarize_result(vmid, data):
+    """One-line summary of a create/power response: VM ID and task ID"""
+    match = TASK_ID_PATTERN.search(response_text(data))
+    return f"   vmid={vmid}, task={match.group(1) if match else '?'}"
+
+def test_basic_endpoints(log=print):
     """Test basic API endpoints"""
     
-    print("🔍 Test basic API endpoints")
-    print(f"🌐 Using base URL: {BASE_URL}")
-    print("=" * 50)
+    log("🔍 Test basic API endpoints")
+    log(f"🌐 Using base URL: {BASE_URL}")
+    log("=" * 50)
     
     # Test get nodes
     try:
-        response = requests.post(f"{BASE_URL}/get_nodes")
-        print(f"✅ get_nodes: {response.status_code} - {len(response.text)} chars")
+        response = SESSION.post(f"{BASE_URL}/get_nodes")
+        try:
+            length = int(response.headers.get("Content-Length") or len(response.content))
+            log(f"✅ get_nodes: {response.status_code} - {length} bytes")
+        finally:
+            response.close()
     except Exception as e:
-        print(f"❌ get_nodes error: {e}")
+        log(f"❌ get_nodes error: {e}")
     
     # Test get VM list
     try:
-        response = requests.post(f"{BASE_URL}/get_vms")
-        print(f"✅ get_vms: {response.status_code} - {len(response.text)} chars")
-        if response.status_code == 200:
-            # Check if our test VMs are included
-            if "test-vm" in response.text:
-                print("  📋 Test VM found")
+        response = SESSION.post(f"{BASE_URL}/get_vms")
+        try:
+            body = response.content
+            log(f"✅ get_vms: {response.status_code} - {len(body)} bytes")
+            if response.status_code == 200:
+                # Check if our test VMs are included (on the raw bytes, no decode)
+                if b"test-vm" in body:
+                    log("  📋 Test VM found")
+                # Remember VM states so later tests can skip no-op actions
+                VM_STATE_CACHE.update(parse_vm_states(loads(body)))
+        finally:
+            response.close()
     except Exception as e:
-        print(f"❌ get_vms error: {e}")
+        log(f"❌ get_vms error: {e}")
 
-def test_vm_creation_api():
+def test_vm_creation_api(log=print):
     """Test VM creation API"""
     
-    print("\n🎉 Test VM creation API - user requested configuration")
-    print("=" * 50)
-    print("Configuration: 1 CPU core, 2GB RAM, 10GB storage")
+    log("\n🎉 Test VM creation API - user requested configuration")
+    log("=" * 50)
+    log("Configuration: 1 CPU core, 2GB RAM, 10GB storage")
     
     # VM creation parameters
     create_data = {
@@ -52,31 +137,30 @@ def test_vm_creation_api():
     }
     
     try:
-        response = requests.post(
-            f"{BASE_URL}/create_vm",
-            json=create_data,
-            headers={"Content-Type": "application/json"}
-        )
+        response = SESSION.post(f"{BASE_URL}/create_vm", json=create_data)
         
-        print(f"📡 API response status: {response.status_code}")
+        log(f"📡 API response status: {response.status_code}")
         
         if response.status_code == 200:
-            result = response.json()
-            print("✅ VM creation successful!")
-            print(f"📄 Response content: {json.dumps(result, indent=2, ensure_ascii=False)}")
+            result = loads(response.content)
+            log("✅ VM creation successful!")
+            if VERBOSE:
+                log(f"📄 Response content: {pretty_json(result)}")
+            else:
+                log(summarize_result(create_data["vmid"], result))
         else:
-            print(f"❌ VM creation failed: {response.text}")
+            log(f"❌ VM creation failed: {response.text}")
             
     except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to API server - please ensure OpenAPI service is running")
+        log("❌ Cannot connect to API server - please ensure OpenAPI service is running")
     except Exception as e:
-        print(f"❌ API call error: {e}")
+        log(f"❌ API call error: {e}")
 
-def test_vm_power_api():
+def test_vm_power_api(log=print):
     """Test VM power management API"""
     
-    print("\n🚀 Test VM power management API")
-    print("=" * 50)
+    log("\n🚀 Test VM power management API")
+    log("=" * 50)
     
     # Test starting VM 101 (VPN-Server)
     start_data = {
@@ -84,65 +168,95 @@ def test_vm_power_api():
         "vmid": "101"
     }
     
+    if VM_STATE_CACHE.get(101) == "running" and not FORCE:
+        log("⏭ VM 101 already running, skipping start (set OPENAPI_TEST_FORCE=1 to send it anyway)")
+        return
+    
     try:
-        response = requests.post(
-            f"{BASE_URL}/start_vm",
-            json=start_data,
-            headers={"Content-Type": "application/json"}
-        )
+        response = SESSION.post(f"{BASE_URL}/start_vm", json=start_data)
         
-        print(f"📡 Start VM 101 response: {response.status_code}")
+        log(f"📡 Start VM 101 response: {response.status_code}")
         
         if response.status_code == 200:
-            result = response.json()
-            print("✅ VM start command successful!")
-            print(f"📄 Response: {json.dumps(result, indent=2, ensure_ascii=False)}")
+            result = loads(response.content)
+            log("✅ VM start command successful!")
+            if VERBOSE:
+                log(f"📄 Response: {pretty_json(result)}")
+            else:
+                log(summarize_result(start_data["vmid"], result))
         else:
-            print(f"❌ VM start failed: {response.text}")
+            log(f"❌ VM start failed: {response.text}")
             
     except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to API server")
+        log("❌ Cannot connect to API server")
     except Exception as e:
-        print(f"❌ API call error: {e}")
+        log(f"❌ API call error: {e}")
+
+def load_openapi_spec():
+    """Get the OpenAPI spec, from the on-disk cache while it is fresh"""
+    try:
+        if time.time() - os.path.getmtime(OPENAPI_CACHE_PATH) < OPENAPI_SPEC_TTL:
+            with open(OPENAPI_CACHE_PATH, "rb") as f:
+                return loads(f.read())
+    except (OSError, ValueError):
+        pass  # No usable cache, fetch it
+    
+    response = SESSION.get(f"{BASE_URL}/openapi.json")
+    if response.status_code != 200:
+        raise RuntimeError(f"Cannot get API specification: {response.status_code}")
+    openapi_spec = loads(response.content)
+    
+    try:
+        tmp_path = f"{OPENAPI_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(openapi_spec, f)
+        os.replace(tmp_path, OPENAPI_CACHE_PATH)
+    except OSError:
+        pass  # Caching is best effort
+    return openapi_spec
 
-def list_available_apis():
+def list_available_apis(log=print):
     """List all available API endpoints"""
     
-    print("\n📋 Available API endpoints")
-    print("=" * 50)
+    log("\n📋 Available API endpoints")
+    log("=" * 50)
     
     try:
-        response = requests.get(f"{BASE_URL}/openapi.json")
-        if response.status_code == 200:
-            openapi_spec = response.json()
-            paths = openapi_spec.get("paths", {})
-            
-            print(f"Found {len(paths)} API endpoints:")
-            for path, methods in paths.items():
-                for method, details in methods.items():
-                    summary = details.get("summary", "No summary")
-                    print(f"  • {method.upper()} {path} - {summary}")
-        else:
-            print(f"❌ Cannot get API specification: {response.status_code}")
+        openapi_spec = load_openapi_spec()
+        paths = openapi_spec.get("paths", {})
+        
+        entries = [
+            (method.upper(), path, details.get("summary", "No summary"))
+            for path, methods in paths.items()
+            for method, details in methods.items()
+        ]
+        body = "\n".join(f"  • {method} {path} - {summary}" for method, path, summary in entries)
+        log(f"Found {len(paths)} API endpoints:\n{body}")
             
+    except RuntimeError as e:
+        log(f"❌ {e}")
     except Exception as e:
-        print(f"❌ Get API list error: {e}")
+        log(f"❌ Get API list error: {e}")
+
+def run_concurrently(*tests):
+    """Run independent tests in parallel, then print each one's output in the order given"""
+    buffers = [[] for _ in tests]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(test, buffer.append) for test, buffer in zip(tests, buffers)]
+    for future, buffer in zip(futures, buffers):
+        print("\n".join(buffer))
+        future.result()
 
 if __name__ == "__main__":
     print("🔍 ProxmoxMCP OpenAPI functionality test")
     print("=" * 60)
     
-    # List available APIs
-    list_available_apis()
-    
-    # Test basic functionality
-    test_basic_endpoints()
-    
-    # Test VM creation functionality
-    test_vm_creation_api()
-    
-    # Test VM power management
-    test_vm_power_api()
+    with SESSION:
+        # Read-only checks: available APIs and basic functionality
+        run_concurrently(list_available_apis, test_basic_endpoints)
+        
+        # Then the changes: VM creation and VM power management
+        run_concurrently(test_vm_creation_api, test_vm_power_api)
     
     print("\n✅ All tests completed")
     print("\n💡 Usage instructions:")
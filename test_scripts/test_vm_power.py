@@ -27,61 +27,43 @@ def test_vm_power_operations():
         
         # Get all VMs
         vms = api.nodes(node_name).qemu.get()
+        by_id = {vm['vmid']: vm for vm in vms}
         print(f"Found {len(vms)} virtual machines:")
+        if vms:
+            sys.stdout.write("\n".join(f"  - VM {vm['vmid']}: {vm['name']} ({vm['status']})" for vm in vms) + "\n")
         
-        vm_101_found = False
-        for vm in vms:
-            vmid = vm['vmid']
-            name = vm['name']
-            status = vm['status']
-            print(f"  - VM {vmid}: {name} ({status})")
-            
-            if vmid == 101:
-                vm_101_found = True
-                print(f"\nFound VPN-Server (ID: 101), current status: {status}")
+        vm = by_id.get(101)
+        if vm is None:
+            print("\n❌ VM 101 (VPN-Server) not found")
+            return True
+        
+        vmid = vm['vmid']
+        status = vm['status']
+        print(f"\nFound VPN-Server (ID: 101), current status: {status}")
+        
+        # Test available status operations
+        vm_api = api.nodes(node_name).qemu(vmid)
+        status_api = vm_api.status
+        
+        print("Test available status operations:")
+        
+        # Try accessing different status endpoints
+        try:
+            # Check which status endpoints exist
+            ops = {op: hasattr(status_api, op) for op in ("start", "stop", "reset", "shutdown")}
+            for op, ok in ops.items():
+                print(f"  {'✅' if ok else '❌'} {'Supports' if ok else 'Does not support'} {op} operation")
                 
-                # Test available status operations
-                vm_api = api.nodes(node_name).qemu(vmid)
-                status_api = vm_api.status
+            # If VM is stopped, try to start
+            if status == 'stopped':
+                print(f"\nVM {vmid} is currently stopped, can try to start")
+                print("Start command would be: api.nodes(node).qemu(101).status.start.post()")
                 
-                print("Test available status operations:")
+            elif status == 'running':
+                print(f"\nVM {vmid} is currently running")
                 
-                # Try accessing different status endpoints
-                try:
-                    # Check if start endpoint exists
-                    if hasattr(status_api, 'start'):
-                        print("  ✅ Supports start operation")
-                    else:
-                        print("  ❌ Does not support start operation")
-                        
-                    if hasattr(status_api, 'stop'):
-                        print("  ✅ Supports stop operation")
-                    else:
-                        print("  ❌ Does not support stop operation")
-                        
-                    if hasattr(status_api, 'reset'):
-                        print("  ✅ Supports reset operation")
-                    else:
-                        print("  ❌ Does not support reset operation")
-                        
-                    if hasattr(status_api, 'shutdown'):
-                        print("  ✅ Supports shutdown operation")
-                    else:
-                        print("  ❌ Does not support shutdown operation")
-                        
-                    # If VM is stopped, try to start
-                    if status == 'stopped':
-                        print(f"\nVM {vmid} is currently stopped, can try to start")
-                        print("Start command would be: api.nodes(node).qemu(101).status.start.post()")
-                        
-                    elif status == 'running':
-                        print(f"\nVM {vmid} is currently running")
-                        
-                except Exception as e:
-                    print(f"  Error while testing operations: {e}")
-        
-        if not vm_101_found:
-            print("\n❌ VM 101 (VPN-Server) not found")
+        except Exception as e:
+            print(f"  Error while testing operations: {e}")
             
     except Exception as e:
         print(f"Test failed: {e}")
@@ -2,9 +2,34 @@
 """
 Test VM startup functionality
 """
+import functools
 import os
 import sys
 
+# Parsed configs keyed by (path, mtime), so an edited file is parsed again
+_CONFIG_CACHE = {}
+
+def _cached_load_config(config_path):
+    """Load and validate a config file once per modification"""
+    from proxmox_mcp.config.loader import load_config
+    
+    key = (config_path, os.path.getmtime(config_path))
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        config = load_config(config_path)
+        _CONFIG_CACHE[key] = config
+    return config
+
+@functools.lru_cache(maxsize=4)
+def _get_vm_tools(config_path, config_mtime):
+    """Build VMTools for a config file once; config_mtime makes edits start over"""
+    from proxmox_mcp.core.proxmox import ProxmoxManager
+    from proxmox_mcp.tools.vm import VMTools
+    
+    config = _cached_load_config(config_path)
+    manager = ProxmoxManager(config.proxmox, config.auth)
+    return VMTools(manager.get_api())
+
 def test_start_vm_101():
     """Test starting VM 101 (VPN-Server)"""
     
@@ -12,15 +37,8 @@ def test_start_vm_101():
     os.environ['PROXMOX_MCP_CONFIG'] = 'proxmox-config/config.json'
     
     try:
-        from proxmox_mcp.config.loader import load_config
-        from proxmox_mcp.core.proxmox import ProxmoxManager
-        from proxmox_mcp.tools.vm import VMTools
-        
-        config = load_config('proxmox-config/config.json')
-        manager = ProxmoxManager(config.proxmox, config.auth)
-        api = manager.get_api()
-        
-        vm_tools = VMTools(api)
+        config_path = os.environ['PROXMOX_MCP_CONFIG']
+        vm_tools = _get_vm_tools(config_path, os.path.getmtime(config_path))
         
         print("🚀 Test starting VPN-Server (VM 101)")
         print("=" * 50)
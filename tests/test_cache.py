@@ -0,0 +1,66 @@
+"""
+Tests for the TTL cache utility.
+"""
+
+from unittest.mock import patch
+
+from proxmox_mcp.utils.cache import TTLCache
+
+def test_get_returns_cached_value():
+    """Test a stored value is returned before it expires."""
+    cache = TTLCache(maxsize=4, ttl=5)
+    cache.set(("get_nodes",), "nodes")
+
+    assert cache.get(("get_nodes",)) == "nodes"
+    assert cache.get(("get_vms",)) is None
+
+def test_entries_expire():
+    """Test entries are dropped once their ttl has passed."""
+    cache = TTLCache(maxsize=4, ttl=5)
+    with patch("proxmox_mcp.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value")
+    with patch("proxmox_mcp.utils.cache.time.monotonic", return_value=104.0):
+        assert cache.get("key") == "value"
+    with patch("proxmox_mcp.utils.cache.time.monotonic", return_value=105.0):
+        assert cache.get("key") is None
+    assert len(cache) == 0
+
+def test_oldest_entry_evicted_at_maxsize():
+    """Test the least recently stored entry is evicted first."""
+    cache = TTLCache(maxsize=2, ttl=5)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+def test_zero_ttl_disables_cache():
+    """Test a ttl of zero never stores anything."""
+    cache = TTLCache(maxsize=4, ttl=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+
+def test_pop_and_clear():
+    """Test explicit invalidation."""
+    cache = TTLCache(maxsize=4, ttl=5)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+
+def test_discard_if():
+    """Test entries are dropped by key predicate."""
+    cache = TTLCache(maxsize=4, ttl=5)
+    cache.set(("pve", "100", "uname -a"), 1)
+    cache.set(("pve", "101", "uname -a"), 2)
+
+    cache.discard_if(lambda key: key[1] == "100")
+
+    assert cache.get(("pve", "100", "uname -a")) is None
+    assert cache.get(("pve", "101", "uname -a")) == 2
@@ -0,0 +1,33 @@
+"""
+Tests for Proxmox API connection setup.
+"""
+
+import pytest
+
+from proxmox_mcp.core.proxmox import _pool_size_from_env
+
+def test_pool_size_defaults_when_unset(monkeypatch):
+    """Test the default pool size is used when the variable is unset."""
+    monkeypatch.delenv("PROXMOX_POOL_MAXSIZE", raising=False)
+
+    assert _pool_size_from_env(32) == 32
+
+def test_pool_size_reads_env(monkeypatch):
+    """Test a valid PROXMOX_POOL_MAXSIZE overrides the default."""
+    monkeypatch.setenv("PROXMOX_POOL_MAXSIZE", "64")
+
+    assert _pool_size_from_env(32) == 64
+
+def test_pool_size_ignores_invalid_value(monkeypatch, caplog):
+    """Test a non-numeric value falls back to the default with a warning."""
+    monkeypatch.setenv("PROXMOX_POOL_MAXSIZE", "abc")
+
+    assert _pool_size_from_env(32) == 32
+    assert "Ignoring invalid PROXMOX_POOL_MAXSIZE='abc'" in caplog.text
+
+@pytest.mark.parametrize("value", ["0", "-5"])
+def test_pool_size_is_at_least_one(monkeypatch, value):
+    """Test too-small values are clamped to a single connection."""
+    monkeypatch.setenv("PROXMOX_POOL_MAXSIZE", value)
+
+    assert _pool_size_from_env(32) == 1
@@ -0,0 +1,198 @@
+"""
+Tests for server-side tool dispatch: batching, caching and request coalescing.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from proxmox_mcp.server import ProxmoxMCPServer
+
+@pytest.fixture
+def mock_proxmox():
+    """Fixture to mock ProxmoxAPI."""
+    with patch("proxmox_mcp.core.proxmox.ProxmoxAPI") as mock:
+        mock.return_value.nodes.get.return_value = [
+            {"node": "node1", "status": "online"}
+        ]
+        mock.return_value.nodes.return_value.status.get.return_value = {
+            "uptime": 3600,
+            "cpuinfo": {"cpus": 4},
+            "memory": {"used": 1024, "total": 4096}
+        }
+        yield mock
+
+@pytest.fixture
+def server(tmp_path, mock_proxmox):
+    """Fixture to create a ProxmoxMCPServer instance from a temporary config."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "proxmox": {"host": "test.proxmox.com"},
+        "auth": {"user": "test@pve", "token_name": "test_token", "token_value": "test_value"},
+        "logging": {"level": "DEBUG"}
+    }))
+    return ProxmoxMCPServer(str(config_path))
+
+@pytest.mark.asyncio
+async def test_batch_execute_registered(server):
+    """Test batch_execute is exposed alongside the regular tools."""
+    tools = await server.mcp.list_tools()
+    assert "batch_execute" in [tool.name for tool in tools]
+
+@pytest.mark.asyncio
+async def test_batch_execute_results_in_order(server):
+    """Test results are returned in request order with per-operation status."""
+    response = await server._execute_batch([
+        {"tool": "get_nodes", "args": {}},
+        {"tool": "get_node_status", "args": {"node": "node1"}},
+        {"tool": "no_such_tool", "args": {}}
+    ])
+    results = json.loads(response[0].text)
+
+    assert [r["id"] for r in results] == [0, 1, 2]
+    assert results[0]["ok"] is True
+    assert "node1" in results[0]["result"]
+    assert results[1]["ok"] is True
+    assert results[2]["ok"] is False
+    assert "Unknown tool" in results[2]["error"]
+
+@pytest.mark.asyncio
+async def test_batch_execute_stop_on_error(server):
+    """Test operations after a failure are skipped when stop_on_error is set."""
+    response = await server._execute_batch(
+        [
+            {"tool": "no_such_tool", "args": {}},
+            {"tool": "get_nodes", "args": {}}
+        ],
+        max_concurrent=1,
+        stop_on_error=True
+    )
+    results = json.loads(response[0].text)
+
+    assert results[0]["ok"] is False
+    assert results[1]["ok"] is False
+    assert "Skipped" in results[1]["error"]
+
+@pytest.mark.asyncio
+async def test_batch_execute_rejects_invalid_vmid(server, mock_proxmox):
+    """Test VM handlers validate vmid even though batch calls skip FastMCP validation."""
+    response = await server._execute_batch([
+        {"tool": "start_vm", "args": {"node": "node1", "vmid": "abc"}}
+    ])
+    results = json.loads(response[0].text)
+
+    assert results[0]["ok"] is False
+    assert "Invalid VM ID" in results[0]["error"]
+    mock_proxmox.return_value.nodes.return_value.qemu.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_request(server):
+    """Test identical concurrent read-only calls are coalesced into one fetch."""
+    calls = []
+    lock = threading.Lock()
+
+    def slow_handler():
+        with lock:
+            calls.append(1)
+        time.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(
+        server._cached("slow", slow_handler),
+        server._cached("slow", slow_handler),
+        server._cached("slow", slow_handler)
+    )
+
+    assert results == ["result", "result", "result"]
+    assert len(calls) == 1
+    assert server._inflight == {}
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_fetch(server):
+    """Test a duplicate caller still gets the result when the first caller is cancelled."""
+    release = threading.Event()
+
+    def slow_handler():
+        release.wait(1)
+        return "result"
+
+    owner = asyncio.create_task(server._cached("slow", slow_handler))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(server._cached("slow", slow_handler))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert server._inflight == {}
+    assert server._cache.get(("slow",)) == "result"
+
+@pytest.mark.asyncio
+async def test_mutating_call_clears_cache(server):
+    """Test read-only results are dropped after a mutating call."""
+    server._cache.set(("get_vms",), "stale")
+
+    await server._invalidating(lambda: "done")
+
+    assert server._cache.get(("get_vms",)) is None
+
+@pytest.mark.asyncio
+async def test_read_overlapping_mutation_is_not_cached(server):
+    """Test a read that started before a mutation does not repopulate the cache."""
+    state = {"vm": "stopped"}
+    release = threading.Event()
+
+    def read():
+        release.wait(1)
+        return state["vm"]
+
+    def mutate():
+        state["vm"] = "running"
+        return "done"
+
+    stale = asyncio.create_task(server._cached("get_vms", read))
+    await asyncio.sleep(0)
+    await server._invalidating(mutate)
+    release.set()
+    await stale
+
+    assert server._cache.get(("get_vms",)) is None
+    assert await server._cached("get_vms", lambda: state["vm"]) == "running"
+
+@pytest.mark.asyncio
+async def test_cancelled_mutation_clears_cache_when_finished(server):
+    """Test a timed-out mutation still invalidates once its worker thread finishes."""
+    release = threading.Event()
+    finished = threading.Event()
+
+    def mutate():
+        release.wait(1)
+        finished.set()
+        return "done"
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(server._invalidating(mutate), 0.01)
+    server._cache.set(("get_vms",), "stale")
+    release.set()
+    await asyncio.to_thread(finished.wait, 1)
+    await asyncio.sleep(0.05)
+
+    assert server._cache.get(("get_vms",)) is None
+
+def test_stalled_shutdown_is_forced(server):
+    """Test a signalled shutdown that cannot unwind still closes the session and exits."""
+    server.proxmox_manager.close = Mock()
+    with patch("proxmox_mcp.server.SHUTDOWN_GRACE_SECONDS", 0.01), \
+            patch("proxmox_mcp.server.os._exit") as exit_mock:
+        server._arm_shutdown_timer()
+        server._shutdown_timer.join(1)
+
+    server.proxmox_manager.close.assert_called_once_with()
+    exit_mock.assert_called_once_with(0)
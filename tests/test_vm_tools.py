@@ -0,0 +1,253 @@
+"""
+Tests for VM management tools.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from mcp.types import TextContent as Content
+
+from proxmox_mcp.tools.vm import VMTools
+
+@pytest.fixture
+def mock_proxmox():
+    """Fixture to create a mock ProxmoxAPI instance."""
+    return Mock()
+
+@pytest.fixture
+def vm_tools(mock_proxmox):
+    """Fixture to create a VMTools instance."""
+    return VMTools(mock_proxmox)
+
+@pytest.mark.parametrize("cpus, memory, disk_size, field", [
+    (0, 2048, 10, "cpus"),
+    (33, 2048, 10, "cpus"),
+    (1, 256, 10, "memory"),
+    (1, 2048, 1001, "disk_size"),
+])
+def test_create_vm_rejects_out_of_range_params(vm_tools, mock_proxmox, cpus, memory, disk_size, field):
+    """Test create_vm bounds are checked before any API call."""
+    with pytest.raises(ValueError, match=field):
+        vm_tools.create_vm("pve", "200", "test-vm", cpus, memory, disk_size)
+
+    mock_proxmox.nodes.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_vms_bulk_reports_each_vm(vm_tools, mock_proxmox):
+    """Test bulk status keeps input order and tolerates failed lookups."""
+    def qemu(vmid):
+        resource = Mock()
+        if vmid == "102":
+            resource.status.current.get.side_effect = Exception("does not exist")
+        elif vmid == "103":
+            resource.status.current.get.side_effect = asyncio.CancelledError()
+        else:
+            resource.status.current.get.return_value = {
+                "name": f"vm-{vmid}", "status": "running", "cpus": 2, "mem": 1024, "maxmem": 2048
+            }
+        return resource
+    mock_proxmox.nodes.return_value.qemu.side_effect = qemu
+
+    result = await vm_tools.get_vms_bulk("pve", ["100", "101", "102", "103"])
+
+    text = result[0].text
+    assert text.index("vm-100") < text.index("vm-101")
+    assert "VM-102" in text
+    assert "VM-103" in text
+
+@pytest.mark.asyncio
+async def test_execute_command_reuses_read_only_output(vm_tools):
+    """Test read-only command output is cached and other commands are not."""
+    vm_tools.console_manager.execute_command = AsyncMock(
+        return_value={"success": True, "output": "Linux", "error": ""}
+    )
+
+    await vm_tools.execute_command("pve", "100", "uname -a")
+    await vm_tools.execute_command("pve", "100", "uname -a")
+    await vm_tools.execute_command("pve", "100", "systemctl restart nginx")
+    await vm_tools.execute_command("pve", "100", "systemctl restart nginx")
+
+    assert vm_tools.console_manager.execute_command.await_count == 3
+
+def test_get_vms_uses_cluster_resources(vm_tools, mock_proxmox):
+    """Test get_vms lists QEMU VMs from one cluster-wide query."""
+    mock_proxmox.cluster.resources.get.return_value = [
+        {"vmid": 100, "name": "vm1", "status": "running", "node": "pve", "type": "qemu",
+         "maxcpu": 2, "mem": 1024, "maxmem": 2048},
+        {"vmid": 200, "name": "ct1", "status": "running", "node": "pve", "type": "lxc",
+         "maxcpu": 1, "mem": 512, "maxmem": 1024},
+    ]
+
+    result = vm_tools.get_vms()
+
+    mock_proxmox.cluster.resources.get.assert_called_once_with(type="vm")
+    mock_proxmox.nodes.assert_not_called()
+    assert "vm1" in result[0].text
+    assert "ct1" not in result[0].text
+
+def test_power_op_skips_when_already_in_state(vm_tools, mock_proxmox):
+    """Test a power action is not issued if the VM is already in that state."""
+    status = mock_proxmox.nodes.return_value.qemu.return_value.status
+    status.current.get.return_value = {"status": "running"}
+
+    result = vm_tools.start_vm("pve", "100")
+
+    assert "already running" in result[0].text
+    status.start.post.assert_not_called()
+
+def test_power_op_posts_action(vm_tools, mock_proxmox):
+    """Test a power action is posted and its task ID reported."""
+    status = mock_proxmox.nodes.return_value.qemu.return_value.status
+    status.current.get.return_value = {"status": "running"}
+    status.shutdown.post.return_value = "UPID:pve:1"
+
+    result = vm_tools.shutdown_vm("pve", "100")
+
+    status.shutdown.post.assert_called_once_with()
+    assert "UPID:pve:1" in result[0].text
+
+def test_power_op_missing_vm(vm_tools, mock_proxmox):
+    """Test a missing VM is reported as ValueError."""
+    status = mock_proxmox.nodes.return_value.qemu.return_value.status
+    status.current.get.side_effect = Exception("Configuration file 'qemu-server/999.conf' does not exist")
+
+    with pytest.raises(ValueError, match="VM 999 not found"):
+        vm_tools.stop_vm("pve", "999")
+
+def test_start_vms_reports_each_target(vm_tools, mock_proxmox):
+    """Test bulk start keeps target order, passes known statuses and reports failures inline."""
+    mock_proxmox.cluster.resources.get.return_value = [
+        {"vmid": 100, "node": "pve", "type": "qemu", "status": "stopped"},
+        {"vmid": 102, "node": "pve", "type": "qemu", "status": "running"},
+    ]
+    def start(node, vmid, current_status=None):
+        if current_status is None:
+            raise ValueError(f"VM {vmid} not found on node {node}")
+        return [Content(type="text", text=f"{vmid} was {current_status}")]
+    vm_tools.start_vm = start
+
+    result = vm_tools.start_vms([("pve", "100"), ("pve", "101"), ("pve", "102")])
+
+    lines = result[0].text.split("\n\n")
+    assert lines[0] == "100 was stopped"
+    assert "Failed to start VM 101" in lines[1]
+    assert lines[2] == "102 was running"
+
+def test_delete_vms_reports_vm_names(vm_tools, mock_proxmox):
+    """Test bulk delete names each VM from the cluster listing without per-VM lookups."""
+    mock_proxmox.cluster.resources.get.return_value = [
+        {"vmid": 100, "name": "web", "node": "pve", "type": "qemu", "status": "stopped"},
+    ]
+    vm_resource = mock_proxmox.nodes.return_value.qemu.return_value
+    vm_resource.delete.return_value = "UPID:pve:1"
+
+    result = vm_tools.delete_vms([("pve", "100")])
+
+    vm_resource.status.current.get.assert_not_called()
+    assert "VM 100 (web)" in result[0].text
+
+def test_power_op_uses_known_status(vm_tools, mock_proxmox):
+    """Test a caller-supplied status skips the status request."""
+    status = mock_proxmox.nodes.return_value.qemu.return_value.status
+
+    vm_tools.stop_vm("pve", "100", current_status="running")
+
+    status.current.get.assert_not_called()
+    status.stop.post.assert_called_once_with()
+
+def test_create_vm_rejects_existing_vmid(vm_tools, mock_proxmox):
+    """Test an ID used anywhere in the cluster is rejected without probing the node."""
+    mock_proxmox.cluster.resources.get.return_value = [
+        {"vmid": 200, "node": "pve2", "type": "lxc"},
+    ]
+
+    with pytest.raises(ValueError, match="VM 200 already exists on node pve2"):
+        vm_tools.create_vm("pve", "200", "test-vm", 1, 2048, 10)
+
+    mock_proxmox.nodes.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_power_op_async_rejects_unknown_action(vm_tools, mock_proxmox):
+    """Test unknown power actions fail before any API call."""
+    with pytest.raises(ValueError, match="Unknown power action"):
+        await vm_tools.power_op_async("pve", "100", "hibernate")
+
+    mock_proxmox.nodes.assert_not_called()
+
+def test_create_vm_picks_images_capable_storage(vm_tools, mock_proxmox):
+    """Test auto-detection matches whole content types, not substrings."""
+    mock_proxmox.cluster.resources.get.return_value = []
+    node = mock_proxmox.nodes.return_value
+    node.storage.get.return_value = [
+        {"storage": "local-lvm", "type": "lvmthin", "content": "rootdir,imagesfoo"},
+        {"storage": "backup", "type": "dir", "content": "backup,iso"},
+        {"storage": "nfs-vms", "type": "nfs", "content": "iso,images"},
+    ]
+    node.qemu.create.return_value = "UPID:pve:1"
+
+    vm_tools.create_vm("pve", "200", "test-vm", 1, 2048, 10)
+
+    config = node.qemu.create.call_args.kwargs
+    assert config["scsi0"] == "nfs-vms:10,format=qcow2"
+    assert config["ide2"] == "nfs-vms:cloudinit"
+
+@pytest.mark.asyncio
+async def test_power_op_drops_cached_command_output(vm_tools, mock_proxmox):
+    """Test cached read-only output is not reused after the VM is stopped."""
+    vm_tools.console_manager.execute_command = AsyncMock(
+        return_value={"success": True, "output": "Linux", "error": ""}
+    )
+    mock_proxmox.nodes.return_value.qemu.return_value.status.current.get.return_value = {"status": "running"}
+
+    await vm_tools.execute_command("pve", "100", "uname -a")
+    await vm_tools.execute_command("pve", "101", "uname -a")
+    vm_tools.stop_vm("pve", "100")
+    await vm_tools.execute_command("pve", "100", "uname -a")
+    await vm_tools.execute_command("pve", "101", "uname -a")
+
+    assert vm_tools.console_manager.execute_command.await_count == 3
+
+STORAGE_LISTING = [
+    {"storage": "local-lvm", "type": "lvmthin", "content": "rootdir,images"},
+]
+
+def test_create_vm_reuses_cached_storage_listing(vm_tools, mock_proxmox):
+    """Test back-to-back creates on one node read the storage listing once."""
+    mock_proxmox.cluster.resources.get.return_value = []
+    node = mock_proxmox.nodes.return_value
+    node.storage.get.return_value = STORAGE_LISTING
+
+    vm_tools.create_vm("pve", "200", "vm-a", 1, 2048, 10)
+    vm_tools.create_vm("pve", "201", "vm-b", 1, 2048, 10)
+
+    assert node.storage.get.call_count == 1
+    assert node.qemu.create.call_count == 2
+
+def test_create_vm_refreshes_storage_listing_for_unknown_storage(vm_tools, mock_proxmox):
+    """Test a storage missing from the cached listing triggers one refetch."""
+    mock_proxmox.cluster.resources.get.return_value = []
+    node = mock_proxmox.nodes.return_value
+    node.storage.get.side_effect = [
+        STORAGE_LISTING,
+        STORAGE_LISTING + [{"storage": "nfs-vms", "type": "nfs", "content": "images"}],
+    ]
+
+    vm_tools.create_vm("pve", "200", "vm-a", 1, 2048, 10)
+    vm_tools.create_vm("pve", "201", "vm-b", 1, 2048, 10, storage="nfs-vms")
+
+    assert node.storage.get.call_count == 2
+    assert node.qemu.create.call_args.kwargs["scsi0"] == "nfs-vms:10,format=qcow2"
+
+def test_create_vm_drops_storage_listing_after_storage_error(vm_tools, mock_proxmox):
+    """Test a storage-related create failure forces a fresh listing next time."""
+    mock_proxmox.cluster.resources.get.return_value = []
+    node = mock_proxmox.nodes.return_value
+    node.storage.get.return_value = STORAGE_LISTING
+    node.qemu.create.side_effect = [Exception("storage 'local-lvm' is full"), "UPID:pve:1"]
+
+    with pytest.raises(RuntimeError):
+        vm_tools.create_vm("pve", "200", "vm-a", 1, 2048, 10)
+    vm_tools.create_vm("pve", "200", "vm-a", 1, 2048, 10)
+
+    assert node.storage.get.call_count == 2